@@ -0,0 +1,35 @@
+"""Add conversations.last_message_at
+
+Revision ID: add_conversation_last_message_at
+Revises: canonical_conversation_pairs
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'add_conversation_last_message_at'
+down_revision = 'canonical_conversation_pairs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'conversations',
+        sa.Column('last_message_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("""
+        UPDATE conversations c
+        SET last_message_at = m.last_at
+        FROM (
+            SELECT conversation_id, max(created_at) AS last_at
+            FROM messages
+            GROUP BY conversation_id
+        ) m
+        WHERE c.id = m.conversation_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('conversations', 'last_message_at')
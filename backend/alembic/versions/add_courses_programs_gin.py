@@ -0,0 +1,25 @@
+"""Add GIN index on courses.programs
+
+Revision ID: add_courses_programs_gin
+Revises: add_message_brin_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_courses_programs_gin'
+down_revision = 'add_message_brin_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_courses_programs_gin',
+        'courses',
+        ['programs'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_courses_programs_gin', table_name='courses')
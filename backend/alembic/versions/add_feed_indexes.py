@@ -0,0 +1,51 @@
+"""Add composite indexes for quest and gig feeds
+
+Revision ID: add_feed_indexes
+Revises: add_signup_attempts
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'add_feed_indexes'
+down_revision = 'add_signup_attempts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Open quests ordered by start time (the default /quests feed)
+    op.create_index(
+        'ix_buddy_open_start',
+        'buddy_requests',
+        ['start_time'],
+        postgresql_where=sa.text("status = 'open'"),
+    )
+    op.create_index(
+        'ix_buddy_category_start',
+        'buddy_requests',
+        ['category', 'start_time'],
+    )
+    # Active gigs filtered by category, newest first
+    op.create_index(
+        'ix_gigs_active_cat',
+        'gigs',
+        ['category', 'created_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+    # Leading-column prefixes of the composites above. The start_time index
+    # predates the scheduled_at -> start_time rename, so it may exist under
+    # either name.
+    op.drop_index('ix_buddy_requests_category', table_name='buddy_requests')
+    op.execute('DROP INDEX IF EXISTS ix_buddy_requests_scheduled_at')
+    op.execute('DROP INDEX IF EXISTS ix_buddy_requests_start_time')
+
+
+def downgrade() -> None:
+    op.create_index('ix_buddy_requests_start_time', 'buddy_requests', ['start_time'])
+    op.create_index('ix_buddy_requests_category', 'buddy_requests', ['category'])
+    op.drop_index('ix_gigs_active_cat', table_name='gigs')
+    op.drop_index('ix_buddy_category_start', table_name='buddy_requests')
+    op.drop_index('ix_buddy_open_start', table_name='buddy_requests')
@@ -0,0 +1,30 @@
+"""Add partial (category, created_at) index for active marketplace listings
+
+Revision ID: add_listing_active_cat_index
+Revises: add_listing_course_codes_gin
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'add_listing_active_cat_index'
+down_revision = 'add_listing_course_codes_gin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_listings_active_cat_created',
+        'marketplace_listings',
+        ['category', 'created_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    # Every status read is now covered by the partial index or user_id
+    op.execute('DROP INDEX IF EXISTS ix_marketplace_listings_status')
+
+
+def downgrade() -> None:
+    op.create_index('ix_marketplace_listings_status', 'marketplace_listings', ['status'])
+    op.drop_index('ix_listings_active_cat_created', table_name='marketplace_listings')
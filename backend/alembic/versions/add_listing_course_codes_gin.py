@@ -0,0 +1,25 @@
+"""Add GIN index on marketplace_listings.course_codes
+
+Revision ID: add_listing_course_codes_gin
+Revises: tune_chat_table_autovacuum
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_listing_course_codes_gin'
+down_revision = 'tune_chat_table_autovacuum'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_marketplace_listings_course_codes_gin',
+        'marketplace_listings',
+        ['course_codes'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_marketplace_listings_course_codes_gin', table_name='marketplace_listings')
@@ -0,0 +1,27 @@
+"""Add trigram GIN index for marketplace listing search
+
+Revision ID: add_listing_text_trgm
+Revises: add_conversation_last_message_at
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_listing_text_trgm'
+down_revision = 'add_conversation_last_message_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_listings_text_trgm',
+        'marketplace_listings',
+        ['title', 'description'],
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops', 'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_listings_text_trgm', table_name='marketplace_listings')
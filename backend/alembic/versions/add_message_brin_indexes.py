@@ -0,0 +1,34 @@
+"""Add BRIN indexes on created_at for append-only message tables
+
+Revision ID: add_message_brin_indexes
+Revises: add_quest_message_thread_root
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_message_brin_indexes'
+down_revision = 'add_quest_message_thread_root'
+branch_labels = None
+depends_on = None
+
+BRIN_INDEXES = [
+    ('ix_course_messages_created_brin', 'course_messages'),
+    ('ix_quest_messages_created_brin', 'quest_messages'),
+    ('ix_gig_responses_created_brin', 'gig_responses'),
+]
+
+
+def upgrade() -> None:
+    for name, table in BRIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade() -> None:
+    for name, table in BRIN_INDEXES:
+        op.drop_index(name, table_name=table)
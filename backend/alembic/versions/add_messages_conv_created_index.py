@@ -0,0 +1,27 @@
+"""Add (conversation_id, created_at) index on messages
+
+Revision ID: add_messages_conv_created_index
+Revises: shrink_marketplace_review_ratings
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_messages_conv_created_index'
+down_revision = 'shrink_marketplace_review_ratings'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_conv_created',
+        'messages',
+        ['conversation_id', 'created_at'],
+    )
+    # Leading column of the composite index covers conversation_id lookups
+    op.execute('DROP INDEX IF EXISTS ix_messages_conversation_id')
+
+
+def downgrade() -> None:
+    op.create_index('ix_messages_conversation_id', 'messages', ['conversation_id'])
+    op.drop_index('ix_messages_conv_created', table_name='messages')
@@ -0,0 +1,32 @@
+"""Add earthdistance GiST index for quest radius lookups
+
+Revision ID: add_quest_geo_index
+Revises: add_feed_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_quest_geo_index'
+down_revision = 'add_feed_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # earthdistance depends on cube; both ship with stock Postgres/Supabase
+    op.execute('CREATE EXTENSION IF NOT EXISTS cube')
+    op.execute('CREATE EXTENSION IF NOT EXISTS earthdistance')
+
+    # Separate B-trees on latitude/longitude cannot serve a radius query
+    op.drop_index('ix_buddy_requests_latitude', table_name='buddy_requests')
+    op.drop_index('ix_buddy_requests_longitude', table_name='buddy_requests')
+    op.execute(
+        'CREATE INDEX ix_buddy_geo ON buddy_requests '
+        'USING gist (ll_to_earth(latitude, longitude))'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_buddy_geo', table_name='buddy_requests')
+    op.create_index('ix_buddy_requests_longitude', 'buddy_requests', ['longitude'])
+    op.create_index('ix_buddy_requests_latitude', 'buddy_requests', ['latitude'])
@@ -0,0 +1,62 @@
+"""Add thread_root_id to quest_messages
+
+Revision ID: add_quest_message_thread_root
+Revises: add_quest_geo_index
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = 'add_quest_message_thread_root'
+down_revision = 'add_quest_geo_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'quest_messages',
+        sa.Column(
+            'thread_root_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('quest_messages.id', ondelete='SET NULL'),
+            nullable=True,
+        ),
+    )
+
+    # Backfill: walk each reply chain down from its top-most message
+    op.execute("""
+        WITH RECURSIVE chain AS (
+            SELECT id, id AS root_id
+            FROM quest_messages
+            WHERE reply_to_id IS NULL
+            UNION ALL
+            SELECT m.id, c.root_id
+            FROM quest_messages m
+            JOIN chain c ON m.reply_to_id = c.id
+        )
+        UPDATE quest_messages q
+        SET thread_root_id = chain.root_id
+        FROM chain
+        WHERE q.id = chain.id AND chain.id <> chain.root_id
+    """)
+
+    op.create_index(
+        'ix_quest_messages_thread',
+        'quest_messages',
+        ['quest_id', 'thread_root_id', 'created_at'],
+    )
+    # Lets the SET NULL action find referencing replies when a message is deleted
+    op.create_index(
+        'ix_quest_messages_thread_root_id',
+        'quest_messages',
+        ['thread_root_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quest_messages_thread_root_id', table_name='quest_messages')
+    op.drop_index('ix_quest_messages_thread', table_name='quest_messages')
+    op.drop_column('quest_messages', 'thread_root_id')
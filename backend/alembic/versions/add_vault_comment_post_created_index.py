@@ -0,0 +1,27 @@
+"""Add (post_id, created_at) index on vault_comments
+
+Revision ID: add_vault_comment_post_created
+Revises: drop_marketplace_review_txn_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'add_vault_comment_post_created'
+down_revision = 'drop_marketplace_review_txn_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_vault_comments_post_created',
+        'vault_comments',
+        ['post_id', 'created_at'],
+    )
+    # Leading column of the composite index covers post_id lookups
+    op.execute('DROP INDEX IF EXISTS ix_vault_comments_post_id')
+
+
+def downgrade() -> None:
+    op.create_index('ix_vault_comments_post_id', 'vault_comments', ['post_id'])
+    op.drop_index('ix_vault_comments_post_created', table_name='vault_comments')
@@ -0,0 +1,37 @@
+"""Add partial feed indexes on vault_posts
+
+Revision ID: add_vault_feed_indexes
+Revises: add_vault_comment_post_created
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'add_vault_feed_indexes'
+down_revision = 'add_vault_comment_post_created'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_vault_posts_active_created',
+        'vault_posts',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.create_index(
+        'ix_vault_posts_active_cat_created',
+        'vault_posts',
+        ['category', 'created_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    # Category is only ever filtered together with status = 'active'
+    op.execute('DROP INDEX IF EXISTS ix_vault_posts_category')
+
+
+def downgrade() -> None:
+    op.create_index('ix_vault_posts_category', 'vault_posts', ['category'])
+    op.drop_index('ix_vault_posts_active_cat_created', table_name='vault_posts')
+    op.drop_index('ix_vault_posts_active_created', table_name='vault_posts')
@@ -0,0 +1,51 @@
+"""Store conversation participants in canonical (user1_id < user2_id) order
+
+Revision ID: canonical_conversation_pairs
+Revises: add_messages_conv_created_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'canonical_conversation_pairs'
+down_revision = 'add_messages_conv_created_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Mirrored pairs (A,B) and (B,A) could both exist; fold the newer one's
+    # messages into the older conversation before reordering
+    op.execute("""
+        CREATE TEMP TABLE conversation_merge ON COMMIT DROP AS
+        SELECT newer.id AS from_id, older.id AS to_id
+        FROM conversations newer
+        JOIN conversations older
+          ON older.user1_id = newer.user2_id
+         AND older.user2_id = newer.user1_id
+         AND (older.created_at, older.id) < (newer.created_at, newer.id)
+    """)
+    op.execute("""
+        UPDATE messages m
+        SET conversation_id = cm.to_id
+        FROM conversation_merge cm
+        WHERE m.conversation_id = cm.from_id
+    """)
+    op.execute("""
+        DELETE FROM conversations c
+        USING conversation_merge cm
+        WHERE c.id = cm.from_id
+    """)
+    op.execute("""
+        UPDATE conversations
+        SET user1_id = user2_id, user2_id = user1_id
+        WHERE user1_id > user2_id
+    """)
+    op.create_check_constraint(
+        'ck_conversations_user_order',
+        'conversations',
+        'user1_id < user2_id',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_conversations_user_order', 'conversations', type_='check')
@@ -0,0 +1,25 @@
+"""Drop redundant marketplace_reviews.transaction_id index
+
+Revision ID: drop_marketplace_review_txn_index
+Revises: add_listing_text_trgm
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'drop_marketplace_review_txn_index'
+down_revision = 'add_listing_text_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_transaction_reviewer (transaction_id, reviewer_id) has it as prefix
+    op.execute('DROP INDEX IF EXISTS ix_marketplace_reviews_transaction_id')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_marketplace_reviews_transaction_id',
+        'marketplace_reviews',
+        ['transaction_id'],
+    )
@@ -0,0 +1,42 @@
+"""Drop users.completed_transactions counter
+
+Revision ID: drop_user_completed_transactions
+Revises: add_listing_active_cat_index
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'drop_user_completed_transactions'
+down_revision = 'add_listing_active_cat_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Now counted from marketplace_transactions at read time
+    op.drop_column('users', 'completed_transactions')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('completed_transactions', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.execute("""
+        UPDATE users u
+        SET completed_transactions = t.n
+        FROM (
+            SELECT user_id, count(*) AS n
+            FROM (
+                SELECT seller_id AS user_id FROM marketplace_transactions
+                WHERE completed_at IS NOT NULL
+                UNION ALL
+                SELECT buyer_id FROM marketplace_transactions
+                WHERE completed_at IS NOT NULL
+            ) parties
+            GROUP BY user_id
+        ) t
+        WHERE u.id = t.user_id
+    """)
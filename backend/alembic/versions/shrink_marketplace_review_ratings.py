@@ -0,0 +1,38 @@
+"""Store marketplace review category ratings as smallint
+
+Revision ID: shrink_marketplace_review_ratings
+Revises: drop_user_completed_transactions
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = 'shrink_marketplace_review_ratings'
+down_revision = 'drop_user_completed_transactions'
+branch_labels = None
+depends_on = None
+
+RATING_COLUMNS = ('item_accuracy', 'communication', 'punctuality')
+
+
+def upgrade() -> None:
+    for column in RATING_COLUMNS:
+        op.alter_column(
+            'marketplace_reviews',
+            column,
+            type_=sa.SmallInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for column in RATING_COLUMNS:
+        op.alter_column(
+            'marketplace_reviews',
+            column,
+            type_=sa.Integer(),
+            existing_type=sa.SmallInteger(),
+            existing_nullable=False,
+        )
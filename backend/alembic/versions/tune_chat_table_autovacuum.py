@@ -0,0 +1,37 @@
+"""Tune autovacuum and fillfactor on high-churn chat tables
+
+Revision ID: tune_chat_table_autovacuum
+Revises: add_courses_programs_gin
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'tune_chat_table_autovacuum'
+down_revision = 'add_courses_programs_gin'
+branch_labels = None
+depends_on = None
+
+TABLES = ['quest_messages', 'course_messages', 'gig_responses']
+
+
+def upgrade() -> None:
+    # Vacuum/analyze after ~2%/1% churn instead of the 20%/10% defaults, and
+    # leave 10% free per page so soft-deletes and status flips stay HOT updates.
+    # fillfactor only applies to pages written from now on.
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE {table} SET ('
+            'autovacuum_vacuum_scale_factor = 0.02, '
+            'autovacuum_analyze_scale_factor = 0.01, '
+            'fillfactor = 90)'
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE {table} RESET ('
+            'autovacuum_vacuum_scale_factor, '
+            'autovacuum_analyze_scale_factor, '
+            'fillfactor)'
+        )
@@ -0,0 +1,27 @@
+"""Upper-case existing marketplace listing course codes
+
+Revision ID: upcase_listing_course_codes
+Revises: add_vault_feed_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'upcase_listing_course_codes'
+down_revision = 'add_vault_feed_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # New listings are stored upper-cased and the course filter matches with @>,
+    # so older lower/mixed-case rows would silently stop matching
+    op.execute("""
+        UPDATE marketplace_listings
+        SET course_codes = upper(course_codes::text)::varchar(20)[]
+        WHERE course_codes::text <> upper(course_codes::text)
+    """)
+
+
+def downgrade() -> None:
+    # The original casing is not recoverable; upper-cased codes are valid input
+    pass
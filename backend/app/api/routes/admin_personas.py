@@ -7,7 +7,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -50,8 +50,7 @@ class PersonaResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class PersonaQuestCreate(BaseModel):
@@ -433,6 +432,7 @@ async def reply_as_persona(
     )
     db.add(message)
     conv.updated_at = datetime.now(timezone.utc)
+    conv.last_message_at = func.now()
     await db.commit()
     await db.refresh(message)
 
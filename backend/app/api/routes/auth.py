@@ -249,7 +249,7 @@ async def admin_login(
     real_ip = getattr(http_request.state, "real_ip", http_request.client.host if http_request.client else "unknown")
     logger.info("ADMIN LOGIN attempt: email=%s ip=%s", request.email, real_ip)
 
-    if request.email.lower() not in [e.lower() for e in ADMIN_EMAILS]:
+    if request.email.lower() not in ADMIN_EMAILS:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised.")
 
     if not settings.admin_password or request.password != settings.admin_password:
@@ -1,16 +1,27 @@
 """Side Quests (buddy matching) API routes."""
 
+import logging
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, or_, select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from sqlalchemy import and_, bindparam, case, func, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import AdminUser, CurrentUser, VerifiedUser
+from app.core.pagination import fetch_page
+from app.models.base import uuid7
 from app.models.buddy import (
     BuddyCategory,
     BuddyParticipant,
@@ -34,10 +45,32 @@ from app.schemas.buddy import (
     QuestMessageResponse,
     QuestMessagesResponse,
 )
-from app.schemas.user import UserMinimal
+from app.schemas.user import user_minimal
+from app.services.redis import PageCache, redis_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/quests", tags=["Side Quests"])
 
+# Feed pages are identical for every viewer; cache them briefly in Redis
+_list_cache = PageCache(redis_service, "quests", ttl_seconds=30)
+
+# Quest chat history, built once and executed with bound parameters
+_QUEST_MESSAGES_QUERY = (
+    select(QuestMessage)
+    .options(
+        selectinload(QuestMessage.sender),
+        selectinload(QuestMessage.reply_to).selectinload(QuestMessage.sender),
+        raiseload("*"),
+    )
+    .where(QuestMessage.quest_id == bindparam("quest_id"))
+    .order_by(QuestMessage.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_QUEST_MESSAGES_BEFORE_QUERY = _QUEST_MESSAGES_QUERY.where(
+    QuestMessage.id < bindparam("before")
+)
+
 
 def _request_to_response(request: BuddyRequest) -> BuddyRequestResponse:
     """Convert buddy request model to response."""
@@ -58,11 +91,7 @@ def _request_to_response(request: BuddyRequest) -> BuddyRequestResponse:
         current_participants=request.current_participants,
         requires_approval=request.requires_approval,
         status=request.status,
-        host=UserMinimal(
-            id=str(request.host.id),
-            name=request.host.name,
-            avatar_url=request.host.avatar_url,
-        ),
+        host=user_minimal(request.host),
         created_at=request.created_at,
     )
 
@@ -71,17 +100,60 @@ def _participant_to_response(participant: BuddyParticipant) -> ParticipantRespon
     """Convert participant model to response."""
     return ParticipantResponse(
         id=str(participant.id),
-        user=UserMinimal(
-            id=str(participant.user.id),
-            name=participant.user.name,
-            avatar_url=participant.user.avatar_url,
-        ),
+        user=user_minimal(participant.user),
         status=participant.status,
         message=participant.message,
         created_at=participant.created_at,
     )
 
 
+async def _claim_spot(db: AsyncSession, quest_id: uuid.UUID) -> bool:
+    """Atomically take one spot in a quest, marking it FULL on the last one.
+
+    Returns False if the quest was already at capacity.
+    """
+    status_type = BuddyRequest.__table__.c.status.type
+    result = await db.execute(
+        update(BuddyRequest)
+        .where(BuddyRequest.id == quest_id)
+        .where(BuddyRequest.current_participants < BuddyRequest.max_participants)
+        .values(
+            current_participants=BuddyRequest.current_participants + 1,
+            status=case(
+                (
+                    BuddyRequest.current_participants + 1 >= BuddyRequest.max_participants,
+                    literal(BuddyRequestStatus.FULL, status_type),
+                ),
+                else_=BuddyRequest.status,
+            ),
+        )
+        .returning(BuddyRequest.id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.first() is not None
+
+
+async def _release_spot(db: AsyncSession, quest_id: uuid.UUID) -> None:
+    """Atomically give back one spot, reopening the quest if it was FULL."""
+    status_type = BuddyRequest.__table__.c.status.type
+    await db.execute(
+        update(BuddyRequest)
+        .where(BuddyRequest.id == quest_id)
+        .values(
+            # Host always counts as 1
+            current_participants=func.greatest(BuddyRequest.current_participants - 1, 1),
+            status=case(
+                (
+                    BuddyRequest.status == BuddyRequestStatus.FULL,
+                    literal(BuddyRequestStatus.OPEN, status_type),
+                ),
+                else_=BuddyRequest.status,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 @router.get("", response_model=BuddyRequestListResponse)
 async def list_quests(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -90,15 +162,38 @@ async def list_quests(
     vibe_level: VibeLevel | None = None,
     date_from: datetime | None = None,
     date_to: datetime | None = None,
+    near_lat: Annotated[float | None, Query(ge=-90, le=90)] = None,
+    near_lng: Annotated[float | None, Query(ge=-180, le=180)] = None,
+    radius_m: Annotated[int, Query(ge=50, le=20000)] = 1000,
     sort_by: Annotated[str, Query(pattern=r"^(newest|starting_soon|most_spots)$")] = "starting_soon",
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=50)] = 20,
 ):
     """List side quests with filters and sorting."""
+    # Location searches are too varied to be worth caching
+    cache_key = None
+    if near_lat is None or near_lng is None:
+        try:
+            cache_key = await _list_cache.key(
+                category and category.value,
+                status and status.value,
+                vibe_level and vibe_level.value,
+                date_from and date_from.isoformat(),
+                date_to and date_to.isoformat(),
+                sort_by,
+                page,
+                per_page,
+            )
+            cached = await _list_cache.get(cache_key)
+            if cached:
+                return Response(content=cached, media_type="application/json")
+        except Exception as e:
+            logger.warning("Quest list cache read failed: %s", e)
+            cache_key = None
 
     query = (
         select(BuddyRequest)
-        .options(selectinload(BuddyRequest.host))
+        .options(selectinload(BuddyRequest.host), raiseload("*"))
     )
 
     # Status filter - default to OPEN if not specified
@@ -121,9 +216,15 @@ async def list_quests(
     if date_to:
         query = query.where(BuddyRequest.start_time <= date_to)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    if near_lat is not None and near_lng is not None:
+        # earth_box prefilter hits the ix_buddy_geo GiST index; earth_distance
+        # trims the box corners down to the actual radius
+        center = func.ll_to_earth(near_lat, near_lng)
+        point = func.ll_to_earth(BuddyRequest.latitude, BuddyRequest.longitude)
+        query = query.where(
+            func.earth_box(center, radius_m).op("@>")(point),
+            func.earth_distance(center, point) <= radius_m,
+        )
 
     # Sorting options
     if sort_by == "newest":
@@ -136,18 +237,23 @@ async def list_quests(
             (BuddyRequest.max_participants - BuddyRequest.current_participants).desc()
         )
 
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    requests = result.scalars().all()
+    requests, total = await fetch_page(db, query, page, per_page)
 
-    return BuddyRequestListResponse(
+    payload = BuddyRequestListResponse(
         items=[_request_to_response(r) for r in requests],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+
+    if cache_key:
+        try:
+            await _list_cache.set(cache_key, payload)
+        except Exception as e:
+            logger.warning("Quest list cache write failed: %s", e)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=BuddyRequestResponse, status_code=status.HTTP_201_CREATED)
@@ -184,6 +290,7 @@ async def create_quest(
 
     db.add(buddy_request)
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(buddy_request, ["host"])
 
     from app.services import push_service
@@ -211,14 +318,14 @@ async def get_my_quests(
     if role == "host":
         query = (
             select(BuddyRequest)
-            .options(selectinload(BuddyRequest.host))
+            .options(selectinload(BuddyRequest.host), raiseload("*"))
             .where(BuddyRequest.user_id == user.id)
         )
     elif role == "participant":
         # Get quests where user is an accepted participant
         query = (
             select(BuddyRequest)
-            .options(selectinload(BuddyRequest.host))
+            .options(selectinload(BuddyRequest.host), raiseload("*"))
             .join(BuddyParticipant)
             .where(BuddyParticipant.user_id == user.id)
             .where(BuddyParticipant.status == ParticipantStatus.ACCEPTED)
@@ -227,7 +334,7 @@ async def get_my_quests(
         # Get quests where user has a pending request
         query = (
             select(BuddyRequest)
-            .options(selectinload(BuddyRequest.host))
+            .options(selectinload(BuddyRequest.host), raiseload("*"))
             .join(BuddyParticipant)
             .where(BuddyParticipant.user_id == user.id)
             .where(BuddyParticipant.status == ParticipantStatus.PENDING)
@@ -236,7 +343,7 @@ async def get_my_quests(
         # Both
         query = (
             select(BuddyRequest)
-            .options(selectinload(BuddyRequest.host))
+            .options(selectinload(BuddyRequest.host), raiseload("*"))
             .outerjoin(BuddyParticipant)
             .where(
                 or_(
@@ -251,23 +358,17 @@ async def get_my_quests(
 
     query = query.where(BuddyRequest.status != BuddyRequestStatus.CANCELLED)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     query = query.order_by(BuddyRequest.start_time.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
+    requests, total = await fetch_page(db, query, page, per_page, unique=True)
 
-    result = await db.execute(query)
-    requests = result.scalars().unique().all()
-
-    return BuddyRequestListResponse(
+    payload = BuddyRequestListResponse(
         items=[_request_to_response(r) for r in requests],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{quest_id}", response_model=BuddyRequestResponse)
@@ -334,6 +435,7 @@ async def update_quest(
         quest.status = request.status
 
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(quest)
 
     return _request_to_response(quest)
@@ -359,6 +461,7 @@ async def cancel_quest(
 
     quest.status = BuddyRequestStatus.CANCELLED
     await db.commit()
+    await _list_cache.invalidate()
 
 
 # Participants
@@ -407,13 +510,12 @@ async def join_quest(
             existing_participant.status = new_status
             existing_participant.message = request.message
 
-            # If auto-accept, update participant count
-            if not quest.requires_approval:
-                quest.current_participants += 1
-                if quest.current_participants >= quest.max_participants:
-                    quest.status = BuddyRequestStatus.FULL
+            # If auto-accept, take a spot
+            if not quest.requires_approval and not await _claim_spot(db, quest.id):
+                raise HTTPException(status_code=400, detail="Quest is full")
 
             await db.commit()
+            await _list_cache.invalidate()
             await db.refresh(existing_participant, ["user"])
             return _participant_to_response(existing_participant)
         else:
@@ -436,13 +538,12 @@ async def join_quest(
 
     db.add(participant)
 
-    # If auto-accept, update participant count
-    if not quest.requires_approval:
-        quest.current_participants += 1
-        if quest.current_participants >= quest.max_participants:
-            quest.status = BuddyRequestStatus.FULL
+    # If auto-accept, take a spot
+    if not quest.requires_approval and not await _claim_spot(db, quest.id):
+        raise HTTPException(status_code=400, detail="Quest is full")
 
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(participant, ["user"])
 
     return _participant_to_response(participant)
@@ -467,7 +568,7 @@ async def list_participants(
 
     query = (
         select(BuddyParticipant)
-        .options(selectinload(BuddyParticipant.user))
+        .options(selectinload(BuddyParticipant.user), raiseload("*"))
         .where(BuddyParticipant.buddy_request_id == quest.id)
     )
 
@@ -478,10 +579,11 @@ async def list_participants(
     result = await db.execute(query.order_by(BuddyParticipant.created_at.asc()))
     participants = result.scalars().all()
 
-    return ParticipantListResponse(
+    payload = ParticipantListResponse(
         items=[_participant_to_response(p) for p in participants],
         total=len(participants),
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{quest_id}/participants/{participant_id}", response_model=ParticipantResponse)
@@ -523,15 +625,14 @@ async def manage_participant(
         if quest.current_participants >= quest.max_participants:
             raise HTTPException(status_code=400, detail="Quest is full")
 
+        if not await _claim_spot(db, quest.id):
+            raise HTTPException(status_code=400, detail="Quest is full")
         participant.status = ParticipantStatus.ACCEPTED
-        quest.current_participants += 1
-
-        if quest.current_participants >= quest.max_participants:
-            quest.status = BuddyRequestStatus.FULL
     else:
         participant.status = ParticipantStatus.REJECTED
 
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(participant)
 
     return _participant_to_response(participant)
@@ -554,19 +655,13 @@ async def leave_quest(
     if not participant:
         raise HTTPException(status_code=404, detail="Not a participant")
 
-    # Update quest count if was accepted
+    # Give the spot back if was accepted
     if participant.status == ParticipantStatus.ACCEPTED:
-        quest_result = await db.execute(
-            select(BuddyRequest).where(BuddyRequest.id == quest_id)
-        )
-        quest = quest_result.scalar_one_or_none()
-        if quest:
-            quest.current_participants = max(1, quest.current_participants - 1)
-            if quest.status == BuddyRequestStatus.FULL:
-                quest.status = BuddyRequestStatus.OPEN
+        await _release_spot(db, participant.buddy_request_id)
 
     participant.status = ParticipantStatus.CANCELLED
     await db.commit()
+    await _list_cache.invalidate()
 
 
 @router.post("/{quest_id}/complete", response_model=BuddyRequestResponse)
@@ -597,6 +692,7 @@ async def complete_quest(
 
     quest.status = BuddyRequestStatus.COMPLETED
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(quest)
 
     return _request_to_response(quest)
@@ -631,15 +727,14 @@ async def remove_participant(
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
 
-    # Update quest count if was accepted
+    # Give the spot back if was accepted
     if participant.status == ParticipantStatus.ACCEPTED:
-        quest.current_participants = max(1, quest.current_participants - 1)
-        if quest.status == BuddyRequestStatus.FULL:
-            quest.status = BuddyRequestStatus.OPEN
+        await _release_spot(db, quest.id)
 
     # Delete the participant record
     await db.delete(participant)
     await db.commit()
+    await _list_cache.invalidate()
 
 
 # Admin endpoints
@@ -652,13 +747,12 @@ async def admin_list_quests(
     per_page: int = Query(50, ge=1, le=100),
 ):
     """List all quests (admin only)."""
-    from app.models.user import User
     offset = (page - 1) * per_page
     total_result = await db.execute(select(func.count(BuddyRequest.id)))
     total = total_result.scalar_one()
     result = await db.execute(
         select(BuddyRequest)
-        .options(selectinload(BuddyRequest.user))
+        .options(selectinload(BuddyRequest.host), raiseload("*"))
         .order_by(BuddyRequest.created_at.desc())
         .offset(offset)
         .limit(per_page)
@@ -667,10 +761,10 @@ async def admin_list_quests(
     items = [
         {
             "id": str(q.id),
-            "title": q.title,
+            "title": q.activity,
             "category": q.category.value if q.category else None,
             "status": q.status.value if q.status else None,
-            "host": {"id": str(q.user.id), "name": q.user.name} if q.user else None,
+            "host": {"id": str(q.host.id), "name": q.host.name} if q.host else None,
             "created_at": q.created_at.isoformat() if q.created_at else None,
         }
         for q in quests
@@ -691,6 +785,7 @@ async def admin_delete_quest(
         raise HTTPException(status_code=404, detail="Quest not found")
     quest.status = BuddyRequestStatus.CANCELLED
     await db.commit()
+    await _list_cache.invalidate()
 
 
 # Cleanup endpoints (for cron jobs / scheduled tasks)
@@ -745,20 +840,12 @@ def _message_to_response(message: QuestMessage) -> QuestMessageResponse:
         reply_info = QuestMessageReplyInfo(
             id=str(message.reply_to.id),
             content=message.reply_to.content,
-            sender=UserMinimal(
-                id=str(message.reply_to.sender.id),
-                name=message.reply_to.sender.name,
-                avatar_url=message.reply_to.sender.avatar_url,
-            ),
+            sender=user_minimal(message.reply_to.sender),
         )
     return QuestMessageResponse(
         id=str(message.id),
         content=message.content if not message.is_deleted else "[Message deleted]",
-        sender=UserMinimal(
-            id=str(message.sender.id),
-            name=message.sender.name,
-            avatar_url=message.sender.avatar_url,
-        ),
+        sender=user_minimal(message.sender),
         reply_to=reply_info,
         created_at=message.created_at,
         is_deleted=message.is_deleted,
@@ -786,22 +873,14 @@ async def get_quest_messages(
     if not await _is_quest_member(db, quest, user.id):
         raise HTTPException(status_code=403, detail="Only quest members can access the chat")
 
-    # Build query with reply_to relationship
-    query = (
-        select(QuestMessage)
-        .options(
-            selectinload(QuestMessage.sender),
-            selectinload(QuestMessage.reply_to).selectinload(QuestMessage.sender),
-        )
-        .where(QuestMessage.quest_id == quest.id)
-    )
-
+    params = {"quest_id": quest.id, "limit": limit + 1}
     if before:
-        query = query.where(QuestMessage.id < before)
-
-    query = query.order_by(QuestMessage.created_at.desc()).limit(limit + 1)
+        query = _QUEST_MESSAGES_BEFORE_QUERY
+        params["before"] = before
+    else:
+        query = _QUEST_MESSAGES_QUERY
 
-    result = await db.execute(query)
+    result = await db.execute(query, params)
     messages = result.scalars().all()
 
     has_more = len(messages) > limit
@@ -837,26 +916,79 @@ async def send_quest_message(
     if not await _is_quest_member(db, quest, user.id):
         raise HTTPException(status_code=403, detail="Only quest members can send messages")
 
+    # Load the parent up front: it supplies the thread root and the reply preview
+    reply_to = None
+    if request.reply_to_id:
+        reply_result = await db.execute(
+            select(QuestMessage)
+            .options(selectinload(QuestMessage.sender))
+            .where(QuestMessage.id == request.reply_to_id)
+            .where(QuestMessage.quest_id == quest.id)
+        )
+        reply_to = reply_result.scalar_one_or_none()
+        if not reply_to:
+            raise HTTPException(status_code=404, detail="Reply target not found")
+
     # Create message
     message = QuestMessage(
-        id=uuid.uuid4(),
+        id=uuid7(),
         quest_id=quest.id,
         sender_id=user.id,
         content=request.content,
-        reply_to_id=uuid.UUID(request.reply_to_id) if request.reply_to_id else None,
+        reply_to_id=reply_to.id if reply_to else None,
+        thread_root_id=(reply_to.thread_root_id or reply_to.id) if reply_to else None,
     )
 
     db.add(message)
     await db.commit()
     await db.refresh(message, ["sender"])
+    message.reply_to = reply_to
 
-    # Load reply_to if needed
-    if message.reply_to_id:
-        reply_result = await db.execute(
-            select(QuestMessage)
-            .options(selectinload(QuestMessage.sender))
-            .where(QuestMessage.id == message.reply_to_id)
+    return _message_to_response(message)
+
+
+@router.get("/{quest_id}/chat/{message_id}/thread", response_model=QuestMessagesResponse)
+async def get_quest_message_thread(
+    quest_id: str,
+    message_id: str,
+    user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Get the full reply thread containing a message, oldest first."""
+    result = await db.execute(
+        select(BuddyRequest).where(BuddyRequest.id == quest_id)
+    )
+    quest = result.scalar_one_or_none()
+
+    if not quest:
+        raise HTTPException(status_code=404, detail="Quest not found")
+
+    if not await _is_quest_member(db, quest, user.id):
+        raise HTTPException(status_code=403, detail="Only quest members can access the chat")
+
+    root_id = (
+        select(func.coalesce(QuestMessage.thread_root_id, QuestMessage.id))
+        .where(QuestMessage.id == message_id)
+        .where(QuestMessage.quest_id == quest.id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(QuestMessage)
+        .options(
+            selectinload(QuestMessage.sender),
+            selectinload(QuestMessage.reply_to).selectinload(QuestMessage.sender),
+            raiseload("*"),
         )
-        message.reply_to = reply_result.scalar_one_or_none()
+        .where(QuestMessage.quest_id == quest.id)
+        .where(or_(QuestMessage.id == root_id, QuestMessage.thread_root_id == root_id))
+        .order_by(QuestMessage.created_at.asc())
+    )
+    messages = result.scalars().all()
 
-    return _message_to_response(message)
+    if not messages:
+        raise HTTPException(status_code=404, detail="Message not found")
+
+    return QuestMessagesResponse(
+        messages=[_message_to_response(m) for m in messages],
+        has_more=False,
+    )
@@ -2,34 +2,46 @@
 
 import re
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Annotated
-from collections import defaultdict
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, UploadFile, File
-from sqlalchemy import and_, func, or_, select, delete
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import AdminUser, CurrentUser, VerifiedUser
+from app.models.base import uuid7
 from app.models.course import (
+    ChannelCreationVote,
+    ChannelMember,
+    ChannelType,
     Course,
     CourseChannel,
     CourseMember,
-    ChannelMember,
     CourseMessage,
-    ChannelCreationVote,
-    ChannelType,
 )
 from app.models.user import User
 from app.schemas.course import (
+    ChannelJoinResponse,
     ChannelListResponse,
     ChannelResponse,
-    ChannelJoinResponse,
     ChatImageUploadRequest,
     ChatImageUploadResponse,
     CourseInHierarchy,
+    CourseMembershipResponse,
     CourseParticipant,
     CourseParticipantsResponse,
     CourseResponse,
@@ -44,7 +56,6 @@ from app.schemas.course import (
     MessageListResponse,
     MessageResponse,
     MyCoursesResponse,
-    CourseMembershipResponse,
     ProgramNode,
     ReplyInfo,
     SeedCoursesResponse,
@@ -61,6 +72,78 @@ router = APIRouter(prefix="/courses", tags=["Courses"])
 # Vote threshold for creating professor channel
 VOTE_THRESHOLD = 5
 
+# Channel history is the hottest read path; build the statement once so each
+# request only binds parameters instead of rebuilding the select and its cache key.
+# It selects plain columns (author and reply joined in) rather than ORM entities,
+# so no identity-map objects are built per row.
+_ReplyMessage = aliased(CourseMessage)
+_ReplyAuthor = aliased(User)
+_CHANNEL_MESSAGES_QUERY = (
+    select(
+        CourseMessage.id,
+        CourseMessage.channel_id,
+        CourseMessage.message,
+        CourseMessage.image_url,
+        CourseMessage.created_at,
+        User.id,
+        User.name,
+        User.avatar_url,
+        _ReplyMessage.id,
+        _ReplyMessage.message,
+        _ReplyMessage.image_url,
+        _ReplyAuthor.id,
+        _ReplyAuthor.name,
+        _ReplyAuthor.avatar_url,
+    )
+    .join(User, User.id == CourseMessage.user_id)
+    .outerjoin(_ReplyMessage, _ReplyMessage.id == CourseMessage.reply_to_id)
+    .outerjoin(_ReplyAuthor, _ReplyAuthor.id == _ReplyMessage.user_id)
+    .where(CourseMessage.channel_id == bindparam("channel_id"))
+    .order_by(CourseMessage.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_CHANNEL_MESSAGES_BEFORE_QUERY = _CHANNEL_MESSAGES_QUERY.where(
+    CourseMessage.created_at < bindparam("before")
+)
+
+
+def _message_to_response(row: tuple) -> MessageResponse:
+    """Build a message response from flat message, author and reply fields.
+
+    Takes the _CHANNEL_MESSAGES_QUERY column layout, which send_message
+    rebuilds for a new message. Rows are trusted DB output, so validation
+    is skipped.
+    """
+    (
+        msg_id, channel_id, message, image_url, created_at,
+        author_id, author_name, author_avatar,
+        reply_id, reply_message, reply_image_url,
+        reply_author_id, reply_author_name, reply_author_avatar,
+    ) = row
+    reply_info = None
+    if reply_id is not None and reply_author_id is not None:
+        reply_info = ReplyInfo.model_construct(
+            id=str(reply_id),
+            message=reply_message,
+            image_url=reply_image_url,
+            author=MessageAuthor.model_construct(
+                id=str(reply_author_id),
+                name=reply_author_name,
+                avatar_url=reply_author_avatar,
+            ),
+        )
+    return MessageResponse.model_construct(
+        id=str(msg_id),
+        channel_id=str(channel_id),
+        message=message,
+        image_url=image_url,
+        author=MessageAuthor.model_construct(
+            id=str(author_id), name=author_name, avatar_url=author_avatar
+        ),
+        reply_to=reply_info,
+        created_at=created_at,
+    )
+
 
 def get_current_semester() -> str:
     """Get current semester code (e.g., W2025, F2024, S2025)."""
@@ -123,35 +206,6 @@ def _channel_to_response(channel: CourseChannel, unread_count: int = 0) -> Chann
     )
 
 
-def _message_to_response(msg: CourseMessage, user: User) -> MessageResponse:
-    """Convert message model to response."""
-    reply_info = None
-    if msg.reply_to and msg.reply_to.user:
-        reply_info = ReplyInfo(
-            id=str(msg.reply_to.id),
-            message=msg.reply_to.message,
-            image_url=msg.reply_to.image_url,
-            author=MessageAuthor(
-                id=str(msg.reply_to.user.id),
-                name=msg.reply_to.user.name,
-                avatar_url=msg.reply_to.user.avatar_url,
-            ),
-        )
-    return MessageResponse(
-        id=str(msg.id),
-        channel_id=str(msg.channel_id),
-        message=msg.message,
-        image_url=msg.image_url,
-        author=MessageAuthor(
-            id=str(user.id),
-            name=user.name,
-            avatar_url=user.avatar_url,
-        ),
-        reply_to=reply_info,
-        created_at=msg.created_at,
-    )
-
-
 # ============ Course Discovery ============
 
 
@@ -159,6 +213,7 @@ def _message_to_response(msg: CourseMessage, user: User) -> MessageResponse:
 async def get_course_hierarchy(
     db: Annotated[AsyncSession, Depends(get_db)],
     campus: str | None = None,
+    program: str | None = None,
 ):
     """Get complete course hierarchy for mind map navigation."""
     query = select(Course).order_by(Course.faculty, Course.code)
@@ -166,6 +221,10 @@ async def get_course_hierarchy(
     if campus:
         query = query.where(Course.campus == campus)
 
+    if program:
+        # programs @> ARRAY[:program] is served by ix_courses_programs_gin
+        query = query.where(Course.programs.contains([program]))
+
     result = await db.execute(query)
     courses = result.scalars().all()
 
@@ -189,9 +248,9 @@ async def get_course_hierarchy(
             member_count=live_counts.get(course.id, 0),
         )
 
-        # Add to each program
-        for program in course.programs:
-            faculty_data[course.faculty][program][course.year].append(course_info)
+        # Add to each program (only the requested one when filtering)
+        for course_program in [program] if program else course.programs:
+            faculty_data[course.faculty][course_program][course.year].append(course_info)
 
     # Convert to response format
     faculties = []
@@ -448,7 +507,11 @@ async def join_course(
     db.add(channel_member)
 
     # Update channel count only (course member_count is now always live from DB)
-    general_channel.member_count += 1
+    await db.execute(
+        update(CourseChannel)
+        .where(CourseChannel.id == general_channel.id)
+        .values(member_count=CourseChannel.member_count + 1)
+    )
 
     await db.commit()
     await db.refresh(course)
@@ -480,21 +543,31 @@ async def leave_course(
         raise HTTPException(status_code=404, detail="Not a member of this course")
 
     # Get course
-    course_result = await db.execute(
-        select(Course)
-        .options(selectinload(Course.channels))
-        .where(Course.id == course_id)
-    )
+    course_result = await db.execute(select(Course).where(Course.id == course_id))
     course = course_result.scalar_one()
 
-    # Remove from all channel memberships in this course
-    for channel in course.channels:
+    # Remove from all channel memberships in this course, then decrement
+    # only the channels the user was actually in
+    removed = await db.execute(
+        delete(ChannelMember)
+        .where(ChannelMember.user_id == user.id)
+        .where(
+            ChannelMember.channel_id.in_(
+                select(CourseChannel.id).where(CourseChannel.course_id == course.id)
+            )
+        )
+        .returning(ChannelMember.channel_id)
+        .execution_options(synchronize_session=False)
+    )
+    left_channel_ids = removed.scalars().all()
+    if left_channel_ids:
         await db.execute(
-            delete(ChannelMember)
-            .where(ChannelMember.user_id == user.id)
-            .where(ChannelMember.channel_id == channel.id)
+            update(CourseChannel)
+            .where(CourseChannel.id.in_(left_channel_ids))
+            .where(CourseChannel.member_count > 0)
+            .values(member_count=CourseChannel.member_count - 1)
+            .execution_options(synchronize_session=False)
         )
-        channel.member_count = max(0, channel.member_count - 1)
 
     # Remove course membership
     await db.delete(membership)
@@ -566,7 +639,8 @@ async def get_course_channels(
 
         channel_responses.append(_channel_to_response(channel, unread_count))
 
-    return ChannelListResponse(channels=channel_responses)
+    payload = ChannelListResponse(channels=channel_responses).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/channels/{channel_id}/join", response_model=ChannelJoinResponse)
@@ -614,7 +688,11 @@ async def join_channel(
     )
     db.add(channel_member)
 
-    channel.member_count += 1
+    await db.execute(
+        update(CourseChannel)
+        .where(CourseChannel.id == channel.id)
+        .values(member_count=CourseChannel.member_count + 1)
+    )
 
     await db.commit()
     await db.refresh(channel)
@@ -735,8 +813,20 @@ async def vote_for_professor(
     if len(prof_name_normalized) < 2:
         raise HTTPException(status_code=400, detail="Professor name too short")
 
-    # Check if channel already exists
     channel_name = f"prof-{prof_name_normalized.replace(' ', '-')}-{semester.lower()}"
+
+    # Serialize votes for this one professor channel until commit, so two
+    # concurrent threshold-crossing votes can't both try to create it (the
+    # loser would hit uq_course_channels_course_name and lose its vote)
+    await db.execute(
+        select(
+            func.pg_advisory_xact_lock(
+                func.hashtext(f"course_vote:{course_id}:{channel_name}")
+            )
+        )
+    )
+
+    # Check if channel already exists
     existing_channel = await db.execute(
         select(CourseChannel)
         .where(CourseChannel.course_id == course_id)
@@ -793,14 +883,15 @@ async def vote_for_professor(
         )
         voter_ids = [v for v in voters_result.scalars().all()]
 
-        for voter_id in voter_ids:
-            channel_member = ChannelMember(
-                id=uuid.uuid4(),
-                user_id=voter_id,
-                channel_id=new_channel.id,
+        if voter_ids:
+            await db.execute(
+                insert(ChannelMember),
+                [
+                    {"id": uuid.uuid4(), "user_id": voter_id, "channel_id": new_channel.id}
+                    for voter_id in voter_ids
+                ],
             )
-            db.add(channel_member)
-            new_channel.member_count += 1
+        new_channel.member_count += len(voter_ids)
 
         channel_created = True
 
@@ -921,30 +1012,22 @@ async def get_channel_messages(
     if not membership.scalar_one_or_none():
         raise HTTPException(status_code=403, detail="Join the course first")
 
-    # Build query with reply_to relationship
-    query = (
-        select(CourseMessage)
-        .options(
-            selectinload(CourseMessage.user),
-            selectinload(CourseMessage.reply_to).selectinload(CourseMessage.user),
-        )
-        .where(CourseMessage.channel_id == channel.id)
-    )
-
+    params = {"channel_id": channel.id, "limit": limit + 1}
     if before:
-        query = query.where(CourseMessage.created_at < before)
-
-    query = query.order_by(CourseMessage.created_at.desc()).limit(limit + 1)
+        query = _CHANNEL_MESSAGES_BEFORE_QUERY
+        params["before"] = before
+    else:
+        query = _CHANNEL_MESSAGES_QUERY
 
-    result = await db.execute(query)
-    messages = list(result.scalars().all())
+    result = await db.execute(query, params)
+    rows = result.all()
 
-    has_more = len(messages) > limit
+    has_more = len(rows) > limit
     if has_more:
-        messages = messages[:limit]
+        rows = rows[:limit]
 
     # Reverse to chronological order
-    messages = list(reversed(messages))
+    rows.reverse()
 
     # Mark messages as read by updating last_read_at for this channel
     channel_member_result = await db.execute(
@@ -957,10 +1040,12 @@ async def get_channel_messages(
         channel_member.last_read_at = datetime.now(timezone.utc)
         await db.commit()
 
-    return MessageListResponse(
-        messages=[_message_to_response(m, m.user) for m in messages],
+    # Serialize the page in one pass instead of FastAPI re-validating it
+    payload = MessageListResponse.model_construct(
+        messages=[_message_to_response(r) for r in rows],
         has_more=has_more,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/channels/{channel_id}/messages", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
@@ -1004,7 +1089,7 @@ async def send_channel_message(
 
     # Create message
     message = CourseMessage(
-        id=uuid.uuid4(),
+        id=uuid7(),
         channel_id=channel.id,
         user_id=user.id,
         message=request.message,
@@ -1016,14 +1101,22 @@ async def send_channel_message(
     await db.commit()
     await db.refresh(message)
 
-    # Load reply_to if needed
+    # Reply preview, in the reply columns of _CHANNEL_MESSAGES_QUERY
+    reply_fields = (None,) * 6
     if message.reply_to_id:
         reply_result = await db.execute(
-            select(CourseMessage)
-            .options(selectinload(CourseMessage.user))
+            select(
+                CourseMessage.id,
+                CourseMessage.message,
+                CourseMessage.image_url,
+                User.id,
+                User.name,
+                User.avatar_url,
+            )
+            .join(User, User.id == CourseMessage.user_id)
             .where(CourseMessage.id == message.reply_to_id)
         )
-        message.reply_to = reply_result.scalar_one_or_none()
+        reply_fields = reply_result.one_or_none() or reply_fields
 
     # Push notification to all course members except sender
     from app.services import push_service
@@ -1036,7 +1129,11 @@ async def send_channel_message(
         "/courses",
     )
 
-    return _message_to_response(message, user)
+    return _message_to_response((
+        message.id, message.channel_id, message.message, message.image_url, message.created_at,
+        user.id, user.name, user.avatar_url,
+        *reply_fields,
+    ))
 
 
 # ============ Admin Endpoints ============
@@ -1250,44 +1347,47 @@ async def seed_courses(
     with open(seed_path, "r", encoding="utf-8") as f:
         courses_data = json.load(f)
 
-    courses_created = 0
-    channels_created = 0
-
+    # Skip codes already in the DB (and repeats within the file) up front
+    result = await db.execute(select(Course.code))
+    seen_codes = set(result.scalars().all())
+    new_courses = []
     for course_data in courses_data:
-        # Check if course already exists
-        existing = await db.execute(
-            select(Course).where(Course.code == course_data["code"])
-        )
-        if existing.scalar_one_or_none():
-            continue
-
-        # Create course
-        course = Course(
-            id=uuid.uuid4(),
-            code=course_data["code"],
-            name=course_data["name"],
-            faculty=course_data["faculty"],
-            programs=course_data["programs"],
-            year=course_data["year"],
-            credits=course_data.get("credits"),
-            campus=course_data.get("campus"),
-        )
-        db.add(course)
-        await db.flush()
-        courses_created += 1
-
-        # Create #general channel
-        general_channel = CourseChannel(
-            id=uuid.uuid4(),
-            course_id=course.id,
-            name="general",
-            type=ChannelType.GENERAL,
-        )
-        db.add(general_channel)
-        channels_created += 1
+        if course_data["code"] not in seen_codes:
+            new_courses.append(course_data)
+            seen_codes.add(course_data["code"])
+
+    # One executemany per batch instead of an ORM add + flush per course
+    batch_size = 1000
+    for i in range(0, len(new_courses), batch_size):
+        course_rows = []
+        channel_rows = []
+        for course_data in new_courses[i:i + batch_size]:
+            course_id = uuid.uuid4()
+            course_rows.append({
+                "id": course_id,
+                "code": course_data["code"],
+                "name": course_data["name"],
+                "faculty": course_data["faculty"],
+                "programs": course_data["programs"],
+                "year": course_data["year"],
+                "credits": course_data.get("credits"),
+                "campus": course_data.get("campus"),
+            })
+            # Create #general channel
+            channel_rows.append({
+                "id": uuid.uuid4(),
+                "course_id": course_id,
+                "name": "general",
+                "type": ChannelType.GENERAL,
+            })
+        await db.execute(insert(Course), course_rows)
+        await db.execute(insert(CourseChannel), channel_rows)
 
     await db.commit()
 
+    courses_created = len(new_courses)
+    channels_created = len(new_courses)
+
     return SeedCoursesResponse(
         courses_created=courses_created,
         channels_created=channels_created,
@@ -1,8 +1,10 @@
 """Dashboard API routes."""
 
+import logging
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,9 +15,16 @@ from app.models.marketplace import MarketplaceListing, ListingStatus
 from app.models.buddy import BuddyRequest, BuddyRequestStatus
 from app.models.vault import VaultPost, VaultPostStatus
 from app.models.user import User
+from app.services.redis import redis_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+# Home page stats cache
+STATS_CACHE_KEY = "dashboard:stats"
+STATS_CACHE_TTL_SECONDS = 60
+
 
 class DashboardStats(BaseModel):
     """Dashboard statistics response."""
@@ -32,58 +41,72 @@ async def get_dashboard_stats(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get dashboard statistics for the home page."""
-    from datetime import datetime, timezone, timedelta
-
-    # Active marketplace listings
-    marketplace_result = await db.execute(
-        select(func.count())
-        .select_from(MarketplaceListing)
-        .where(MarketplaceListing.status == ListingStatus.ACTIVE)
-    )
-    marketplace_count = marketplace_result.scalar() or 0
-
-    # Active side quests (open or in progress)
-    quests_result = await db.execute(
-        select(func.count())
-        .select_from(BuddyRequest)
-        .where(
-            BuddyRequest.status.in_([
-                BuddyRequestStatus.OPEN,
-                BuddyRequestStatus.IN_PROGRESS,
-            ])
-        )
-    )
-    quests_count = quests_result.scalar() or 0
-
-    # Total courses
-    courses_result = await db.execute(
-        select(func.count()).select_from(Course)
-    )
-    courses_count = courses_result.scalar() or 0
+    # Every home page load asks for these; a minute of staleness is fine
+    try:
+        cached = await redis_service.get(STATS_CACHE_KEY)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+    except Exception as e:
+        logger.warning("Dashboard stats cache read failed: %s", e)
 
-    # Vault posts in last 24 hours
     yesterday = datetime.now(timezone.utc) - timedelta(hours=24)
-    vault_result = await db.execute(
-        select(func.count())
-        .select_from(VaultPost)
-        .where(VaultPost.created_at >= yesterday)
-        .where(VaultPost.status == VaultPostStatus.ACTIVE)
-    )
-    vault_today = vault_result.scalar() or 0
-
-    # Total active users
-    users_result = await db.execute(
-        select(func.count())
-        .select_from(User)
-        .where(User.is_active == True)
-        .where(User.email_verified == True)
+
+    # All five counts in one round trip
+    result = await db.execute(
+        select(
+            # Active marketplace listings
+            select(func.count())
+            .select_from(MarketplaceListing)
+            .where(MarketplaceListing.status == ListingStatus.ACTIVE)
+            .scalar_subquery(),
+            # Active side quests (open or in progress)
+            select(func.count())
+            .select_from(BuddyRequest)
+            .where(
+                BuddyRequest.status.in_([
+                    BuddyRequestStatus.OPEN,
+                    BuddyRequestStatus.IN_PROGRESS,
+                ])
+            )
+            .scalar_subquery(),
+            # Total courses
+            select(func.count()).select_from(Course).scalar_subquery(),
+            # Vault posts in last 24 hours
+            select(func.count())
+            .select_from(VaultPost)
+            .where(VaultPost.created_at >= yesterday)
+            .where(VaultPost.status == VaultPostStatus.ACTIVE)
+            .scalar_subquery(),
+            # Total active users
+            select(func.count())
+            .select_from(User)
+            .where(User.is_active == True)
+            .where(User.email_verified == True)
+            .scalar_subquery(),
+        )
     )
-    users_count = users_result.scalar() or 0
+    (
+        marketplace_count,
+        quests_count,
+        courses_count,
+        vault_today,
+        users_count,
+    ) = result.one()
 
-    return DashboardStats(
+    stats = DashboardStats(
         marketplace_listings=marketplace_count,
         side_quests_active=quests_count,
         total_courses=courses_count,
         vault_posts_today=vault_today,
         total_users=users_count,
     )
+
+    payload = stats.model_dump_json()
+    try:
+        await redis_service.set(
+            STATS_CACHE_KEY, payload, expire_seconds=STATS_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning("Dashboard stats cache write failed: %s", e)
+
+    return Response(content=payload, media_type="application/json")
@@ -3,10 +3,10 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import CurrentUser, VerifiedUser, AdminUser
@@ -94,7 +94,7 @@ async def get_my_feedback(
     # Get feedback
     result = await db.execute(
         select(UserFeedback)
-        .options(selectinload(UserFeedback.user))
+        .options(selectinload(UserFeedback.user), raiseload("*"))
         .where(UserFeedback.user_id == user.id)
         .order_by(UserFeedback.created_at.desc())
         .offset(offset)
@@ -102,10 +102,11 @@ async def get_my_feedback(
     )
     feedback_list = result.scalars().all()
 
-    return FeedbackListResponse(
+    payload = FeedbackListResponse(
         items=[_feedback_to_response(f) for f in feedback_list],
         total=total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.patch("/admin/{feedback_id}/resolve", response_model=FeedbackResponse)
@@ -178,14 +179,15 @@ async def get_all_feedback(
     # Get feedback
     result = await db.execute(
         base_query
-        .options(selectinload(UserFeedback.user))
+        .options(selectinload(UserFeedback.user), raiseload("*"))
         .order_by(UserFeedback.created_at.desc())
         .offset(offset)
         .limit(per_page)
     )
     feedback_list = result.scalars().all()
 
-    return FeedbackListResponse(
+    payload = FeedbackListResponse(
         items=[_feedback_to_response(f) for f in feedback_list],
         total=total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
@@ -1,53 +1,70 @@
 """API routes for Quick Gigs marketplace."""
 
+import logging
 import uuid
-from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Literal
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, or_, select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.pagination import fetch_page
 from app.models.gig import (
     Gig,
-    GigResponse as GigResponseModel,
-    GigTransaction,
-    GigRating,
-    GigType,
     GigCategory,
-    GigPriceType,
     GigLocation,
-    GigStatus,
+    GigPriceType,
+    GigRating,
     GigResponseStatus,
+    GigStatus,
+    GigTransaction,
     GigTransactionStatus,
+    GigType,
+)
+from app.models.gig import (
+    GigResponse as GigResponseModel,
 )
+from app.models.user import User
 from app.schemas.gig import (
+    GigCompleteResult,
     GigCreate,
-    GigUpdate,
-    GigResponse,
     GigListResponse,
+    GigProfileResponse,
+    GigRatingCreate,
+    GigRatingListResponse,
+    GigRatingResponse,
+    GigResponse,
+    GigResponseActionResult,
     GigResponseCreate,
     GigResponseItem,
     GigResponsesListResponse,
-    GigResponseActionResult,
-    GigTransactionResponse,
     GigTransactionListResponse,
-    GigCompleteResult,
-    GigRatingCreate,
-    GigRatingResponse,
-    GigRatingListResponse,
-    GigProfileResponse,
+    GigTransactionResponse,
+    GigUpdate,
     GigUserInfo,
     GigUserMinimal,
 )
+from app.services.redis import PageCache, redis_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/gigs", tags=["gigs"])
 
+# Browse pages are identical for every viewer; cache them briefly in Redis
+_list_cache = PageCache(redis_service, "gigs", ttl_seconds=10)
+
 
 def _user_to_info(user: User) -> dict:
     """Convert user to GigUserInfo dict."""
@@ -110,7 +127,21 @@ async def get_gigs(
     db: AsyncSession = Depends(get_db),
 ):
     """Browse gigs with filters."""
-    query = select(Gig).options(selectinload(Gig.poster))
+    # Free-text searches are too varied to be worth caching
+    cache_key = None
+    if not search:
+        try:
+            cache_key = await _list_cache.key(
+                gig_type, category, min_price, max_price, location, sort, page, per_page
+            )
+            cached = await _list_cache.get(cache_key)
+            if cached:
+                return Response(content=cached, media_type="application/json")
+        except Exception as e:
+            logger.warning("Gig list cache read failed: %s", e)
+            cache_key = None
+
+    query = select(Gig).options(selectinload(Gig.poster), raiseload("*"))
 
     # Only show active gigs by default
     query = query.where(Gig.status == GigStatus.ACTIVE)
@@ -135,10 +166,6 @@ async def get_gigs(
             )
         )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Sort
     if sort == "recent":
         query = query.order_by(Gig.created_at.desc())
@@ -149,20 +176,23 @@ async def get_gigs(
     elif sort == "highest_rated":
         query = query.join(User, Gig.poster_id == User.id).order_by(User.gig_rating_avg.desc())
 
-    # Paginate
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
+    gigs, total = await fetch_page(db, query, page, per_page)
 
-    result = await db.execute(query)
-    gigs = result.scalars().all()
+    payload = GigListResponse(
+        items=[_gig_to_response(g) for g in gigs],
+        total=total,
+        page=page,
+        per_page=per_page,
+        has_more=(page - 1) * per_page + len(gigs) < total,
+    ).model_dump_json()
 
-    return {
-        "items": [_gig_to_response(g) for g in gigs],
-        "total": total,
-        "page": page,
-        "per_page": per_page,
-        "has_more": offset + len(gigs) < total,
-    }
+    if cache_key:
+        try:
+            await _list_cache.set(cache_key, payload)
+        except Exception as e:
+            logger.warning("Gig list cache write failed: %s", e)
+
+    return Response(content=payload, media_type="application/json")
 
 
 # Create gig
@@ -190,6 +220,7 @@ async def create_gig(
 
     db.add(gig)
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(gig, ["poster"])
 
     from app.services import push_service
@@ -219,8 +250,10 @@ async def get_gig(
     if not gig:
         raise HTTPException(status_code=404, detail="Gig not found")
 
-    # Increment view count
-    gig.view_count += 1
+    # Increment view count in SQL so concurrent views are not lost
+    await db.execute(
+        update(Gig).where(Gig.id == gig_id).values(view_count=Gig.view_count + 1)
+    )
     await db.commit()
 
     return _gig_to_response(gig)
@@ -255,6 +288,7 @@ async def update_gig(
         setattr(gig, field, value)
 
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(gig)
 
     return _gig_to_response(gig)
@@ -279,6 +313,7 @@ async def delete_gig(
 
     await db.delete(gig)
     await db.commit()
+    await _list_cache.invalidate()
 
 
 # Respond to gig
@@ -330,8 +365,11 @@ async def respond_to_gig(
     )
 
     db.add(response)
-    gig.response_count += 1
+    await db.execute(
+        update(Gig).where(Gig.id == gig_id).values(response_count=Gig.response_count + 1)
+    )
     await db.commit()
+    await _list_cache.invalidate()
     await db.refresh(response, ["responder"])
 
     return {
@@ -367,7 +405,7 @@ async def get_gig_responses(
     # Get responses
     responses_query = (
         select(GigResponseModel)
-        .options(selectinload(GigResponseModel.responder))
+        .options(selectinload(GigResponseModel.responder), raiseload("*"))
         .where(GigResponseModel.gig_id == gig_id)
         .order_by(GigResponseModel.created_at.desc())
     )
@@ -463,6 +501,7 @@ async def accept_response(
 
     db.add(transaction)
     await db.commit()
+    await _list_cache.invalidate()
 
     return {
         "success": True,
@@ -547,37 +586,62 @@ async def complete_gig(
     if not is_provider and not is_client:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Set confirmation
+    # Set confirmation and read back both flags in one statement, so two
+    # parties confirming at the same time always see each other's flag
+    confirmation = {}
     if is_provider:
-        transaction.provider_confirmed = True
+        confirmation["provider_confirmed"] = True
     if is_client:
-        transaction.client_confirmed = True
-
-    # Check if both confirmed
-    both_confirmed = transaction.provider_confirmed and transaction.client_confirmed
+        confirmation["client_confirmed"] = True
+
+    flags_result = await db.execute(
+        update(GigTransaction)
+        .where(GigTransaction.id == transaction.id)
+        .values(**confirmation)
+        .returning(GigTransaction.provider_confirmed, GigTransaction.client_confirmed)
+        .execution_options(synchronize_session=False)
+    )
+    flags = flags_result.one()
+    both_confirmed = flags.provider_confirmed and flags.client_confirmed
+    transaction_status = transaction.status
 
     if both_confirmed:
-        transaction.status = GigTransactionStatus.COMPLETED
-        transaction.completed_at = datetime.now(timezone.utc)
-        gig.status = GigStatus.COMPLETED
-
-        # Update provider stats
-        if transaction.provider_id:
-            provider_query = select(User).where(User.id == transaction.provider_id)
-            provider_result = await db.execute(provider_query)
-            provider = provider_result.scalar_one_or_none()
-            if provider:
-                provider.gigs_completed += 1
-                provider.total_earned += transaction.amount
+        # Only the request that actually flips the status credits the provider
+        completed_result = await db.execute(
+            update(GigTransaction)
+            .where(GigTransaction.id == transaction.id)
+            .where(GigTransaction.status != GigTransactionStatus.COMPLETED)
+            .values(status=GigTransactionStatus.COMPLETED, completed_at=func.now())
+            .returning(GigTransaction.id)
+            .execution_options(synchronize_session=False)
+        )
+        transaction_status = GigTransactionStatus.COMPLETED
+
+        if completed_result.first() is not None:
+            gig.status = GigStatus.COMPLETED
+
+            # Update provider stats
+            if transaction.provider_id:
+                await db.execute(
+                    update(User)
+                    .where(User.id == transaction.provider_id)
+                    .values(
+                        gigs_completed=User.gigs_completed + 1,
+                        total_earned=User.total_earned + transaction.amount,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
 
     await db.commit()
+    if both_confirmed:
+        await _list_cache.invalidate()
 
     return {
         "success": True,
         "message": "Completion confirmed" if not both_confirmed else "Gig completed",
         "transaction_id": str(transaction.id),
         "both_confirmed": both_confirmed,
-        "status": transaction.status.value,
+        "status": transaction_status.value,
     }
 
 
@@ -684,7 +748,7 @@ async def get_my_gigs(
     if type in ("posted", "all"):
         posted_query = (
             select(Gig)
-            .options(selectinload(Gig.poster))
+            .options(selectinload(Gig.poster), raiseload("*"))
             .where(Gig.poster_id == current_user.id)
             .order_by(Gig.created_at.desc())
             .offset(offset)
@@ -697,7 +761,7 @@ async def get_my_gigs(
     if type in ("responded", "all"):
         responded_query = (
             select(GigResponseModel)
-            .options(selectinload(GigResponseModel.responder), selectinload(GigResponseModel.gig))
+            .options(selectinload(GigResponseModel.responder), raiseload("*"))
             .where(GigResponseModel.responder_id == current_user.id)
             .order_by(GigResponseModel.created_at.desc())
             .offset(offset)
@@ -739,7 +803,7 @@ async def get_user_gig_profile(
     # Get recent ratings
     ratings_query = (
         select(GigRating)
-        .options(selectinload(GigRating.rater))
+        .options(selectinload(GigRating.rater), raiseload("*"))
         .where(GigRating.ratee_id == user_id)
         .order_by(GigRating.created_at.desc())
         .limit(5)
@@ -809,6 +873,7 @@ async def get_my_transactions(
             selectinload(GigTransaction.gig).selectinload(Gig.poster),
             selectinload(GigTransaction.provider),
             selectinload(GigTransaction.client),
+            raiseload("*"),
         )
         .where(
             or_(
@@ -821,16 +886,9 @@ async def get_my_transactions(
     if status:
         query = query.where(GigTransaction.status == GigTransactionStatus(status))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    query = query.order_by(GigTransaction.created_at.desc())
 
-    # Paginate
-    offset = (page - 1) * per_page
-    query = query.order_by(GigTransaction.created_at.desc()).offset(offset).limit(per_page)
-
-    result = await db.execute(query)
-    transactions = result.scalars().all()
+    transactions, total = await fetch_page(db, query, page, per_page)
 
     return {
         "items": [
@@ -856,5 +914,5 @@ async def get_my_transactions(
         "total": total,
         "page": page,
         "per_page": per_page,
-        "has_more": offset + len(transactions) < total,
+        "has_more": (page - 1) * per_page + len(transactions) < total,
     }
@@ -7,13 +7,28 @@ logger = logging.getLogger(__name__)
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
-from sqlalchemy import func, or_, select
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from app.core.database import get_db
-from app.core.dependencies import AdminUser, CurrentUser, CurrentUserOptional, VerifiedUser
+from app.core.dependencies import (
+    AdminUser,
+    CurrentUser,
+    CurrentUserOptional,
+    VerifiedUser,
+)
+from app.core.pagination import fetch_page
 from app.models.marketplace import (
     ListingCondition,
     ListingStatus,
@@ -38,7 +53,7 @@ from app.schemas.marketplace_review import (
     PendingReviewResponse,
     PendingReviewsListResponse,
 )
-from app.schemas.user import UserMinimal
+from app.schemas.user import USER_MINIMAL_COLUMNS, user_minimal
 from app.services.storage import storage_service
 
 # Review window in days
@@ -50,8 +65,8 @@ router = APIRouter(prefix="/marketplace", tags=["Marketplace"])
 
 
 def _listing_to_response(listing: MarketplaceListing) -> ListingResponse:
-    """Convert listing model to response."""
-    return ListingResponse(
+    """Convert listing model to response (trusted DB row, so no validation)."""
+    return ListingResponse.model_construct(
         id=str(listing.id),
         title=listing.title,
         description=listing.description,
@@ -64,11 +79,7 @@ def _listing_to_response(listing: MarketplaceListing) -> ListingResponse:
         status=listing.status,
         preferred_meetup_location=listing.preferred_meetup_location,
         view_count=listing.view_count,
-        seller=UserMinimal(
-            id=str(listing.seller.id),
-            name=listing.seller.name,
-            avatar_url=listing.seller.avatar_url,
-        ),
+        seller=user_minimal(listing.seller),
         created_at=listing.created_at,
         updated_at=listing.updated_at,
     )
@@ -89,7 +100,9 @@ async def list_listings(
     """List marketplace listings with filters."""
     query = (
         select(MarketplaceListing)
-        .options(selectinload(MarketplaceListing.seller))
+        .options(
+            selectinload(MarketplaceListing.seller).load_only(*USER_MINIMAL_COLUMNS)
+        )
         .where(MarketplaceListing.status == ListingStatus.ACTIVE)
     )
 
@@ -107,13 +120,13 @@ async def list_listings(
         query = query.where(MarketplaceListing.price <= max_price)
 
     if course_code:
-        # Search in course_codes array
+        # Search in course_codes array (@> is served by the GIN index; = ANY() is not)
         query = query.where(
-            MarketplaceListing.course_codes.any(course_code.upper())
+            MarketplaceListing.course_codes.contains([course_code.upper()])
         )
 
     if search:
-        # Search in title and description
+        # Search in title and description (served by ix_listings_text_trgm)
         search_term = f"%{search}%"
         query = query.where(
             or_(
@@ -122,24 +135,18 @@ async def list_listings(
             )
         )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Paginate
     query = query.order_by(MarketplaceListing.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
+    listings, total = await fetch_page(db, query, page, per_page)
 
-    result = await db.execute(query)
-    listings = result.scalars().all()
-
-    return ListingListResponse(
+    payload = ListingListResponse.model_construct(
         items=[_listing_to_response(l) for l in listings],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=ListingResponse, status_code=status.HTTP_201_CREATED)
@@ -189,24 +196,18 @@ async def get_my_listings(
     if status_filter:
         query = query.where(MarketplaceListing.status == status_filter)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Paginate
     query = query.order_by(MarketplaceListing.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    listings = result.scalars().all()
+    listings, total = await fetch_page(db, query, page, per_page)
 
-    return ListingListResponse(
+    payload = ListingListResponse.model_construct(
         items=[_listing_to_response(l) for l in listings],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{listing_id}", response_model=ListingResponse)
@@ -241,16 +242,12 @@ async def get_listing(
 
     # Increment view count (don't count own views)
     if not user or str(user.id) != str(listing.user_id):
-        listing.view_count += 1
-        await db.commit()
-
-        # Re-query to ensure seller relationship is loaded after commit
-        result = await db.execute(
-            select(MarketplaceListing)
-            .options(selectinload(MarketplaceListing.seller))
+        await db.execute(
+            update(MarketplaceListing)
             .where(MarketplaceListing.id == listing_uuid)
+            .values(view_count=MarketplaceListing.view_count + 1)
         )
-        listing = result.scalar_one_or_none()
+        await db.commit()
 
     return _listing_to_response(listing)
 
@@ -448,20 +445,11 @@ def _review_to_response(review: MarketplaceReview) -> MarketplaceReviewResponse:
     return MarketplaceReviewResponse(
         id=str(review.id),
         transaction_id=str(review.transaction_id),
-        reviewer=UserMinimal(
-            id=str(review.reviewer.id),
-            name=review.reviewer.name,
-            avatar_url=review.reviewer.avatar_url,
-        ),
-        reviewee=UserMinimal(
-            id=str(review.reviewee.id),
-            name=review.reviewee.name,
-            avatar_url=review.reviewee.avatar_url,
-        ),
+        reviewer=user_minimal(review.reviewer),
+        reviewee=user_minimal(review.reviewee),
         item_accuracy=review.item_accuracy,
         communication=review.communication,
         punctuality=review.punctuality,
-        average_rating=review.average_rating,
         text_feedback=review.text_feedback,
         created_at=review.created_at,
     )
@@ -555,8 +543,8 @@ async def submit_marketplace_review(
     result = await db.execute(
         select(MarketplaceReview)
         .options(
-            selectinload(MarketplaceReview.reviewer),
-            selectinload(MarketplaceReview.reviewee),
+            joinedload(MarketplaceReview.reviewer).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(MarketplaceReview.reviewee).load_only(*USER_MINIMAL_COLUMNS),
         )
         .where(MarketplaceReview.id == review.id)
     )
@@ -595,16 +583,21 @@ async def get_pending_reviews(
     result = await db.execute(query)
     transactions = result.scalars().all()
 
-    pending = []
-    for txn in transactions:
-        # Check if user already reviewed this transaction
-        existing = await db.execute(
-            select(MarketplaceReview).where(
-                MarketplaceReview.transaction_id == txn.id,
+    # Transactions the user already reviewed, in one uq_transaction_reviewer
+    # lookup rather than one query per transaction
+    reviewed_ids: set[uuid.UUID] = set()
+    if transactions:
+        result = await db.execute(
+            select(MarketplaceReview.transaction_id).where(
+                MarketplaceReview.transaction_id.in_([t.id for t in transactions]),
                 MarketplaceReview.reviewer_id == user.id,
             )
         )
-        if existing.scalar_one_or_none():
+        reviewed_ids = set(result.scalars().all())
+
+    pending = []
+    for txn in transactions:
+        if txn.id in reviewed_ids:
             continue
 
         # Determine role and other party
@@ -616,18 +609,15 @@ async def get_pending_reviews(
             PendingReviewResponse(
                 transaction_id=str(txn.id),
                 listing_title=txn.listing.title,
-                other_party=UserMinimal(
-                    id=str(other_party.id),
-                    name=other_party.name,
-                    avatar_url=other_party.avatar_url,
-                ),
+                other_party=user_minimal(other_party),
                 role=role,
                 completed_at=txn.completed_at,
                 review_deadline=txn.completed_at + timedelta(days=REVIEW_WINDOW_DAYS),
             )
         )
 
-    return PendingReviewsListResponse(items=pending)
+    payload = PendingReviewsListResponse(items=pending).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/users/{user_id}/reputation", response_model=MarketplaceReputationResponse)
@@ -642,46 +632,60 @@ async def get_user_marketplace_reputation(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID format")
 
-    # Get user
-    result = await db.execute(select(User).where(User.id == user_uuid))
-    target_user = result.scalar_one_or_none()
-
-    if not target_user:
+    # Check user exists
+    result = await db.execute(select(User.id).where(User.id == user_uuid))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Check grace period
-    reviews_visible = target_user.completed_transactions >= GRACE_PERIOD_TRANSACTIONS
-
-    # Get all reviews for this user
+    # Check grace period (counted from transactions so completing one never
+    # has to write to either party's users row)
     result = await db.execute(
-        select(MarketplaceReview)
-        .options(
-            selectinload(MarketplaceReview.reviewer),
-            selectinload(MarketplaceReview.reviewee),
+        select(func.count(MarketplaceTransaction.id)).where(
+            or_(
+                MarketplaceTransaction.seller_id == user_uuid,
+                MarketplaceTransaction.buyer_id == user_uuid,
+            ),
+            MarketplaceTransaction.completed_at.isnot(None),
         )
-        .where(MarketplaceReview.reviewee_id == user_uuid)
-        .order_by(MarketplaceReview.created_at.desc())
     )
-    reviews = result.scalars().all()
-
-    total_reviews = len(reviews)
-
-    # Calculate averages
-    if total_reviews > 0:
-        avg_item_accuracy = sum(r.item_accuracy for r in reviews) / total_reviews
-        avg_communication = sum(r.communication for r in reviews) / total_reviews
-        avg_punctuality = sum(r.punctuality for r in reviews) / total_reviews
-        overall_average = (avg_item_accuracy + avg_communication + avg_punctuality) / 3
-    else:
-        avg_item_accuracy = None
-        avg_communication = None
-        avg_punctuality = None
-        overall_average = None
-
-    # Build response
+    completed_transactions = result.scalar() or 0
+    reviews_visible = completed_transactions >= GRACE_PERIOD_TRANSACTIONS
+
+    # Aggregate ratings in SQL rather than loading every review
+    result = await db.execute(
+        select(
+            func.count(MarketplaceReview.id),
+            func.avg(MarketplaceReview.item_accuracy),
+            func.avg(MarketplaceReview.communication),
+            func.avg(MarketplaceReview.punctuality),
+        ).where(MarketplaceReview.reviewee_id == user_uuid)
+    )
+    (
+        total_reviews,
+        avg_item_accuracy,
+        avg_communication,
+        avg_punctuality,
+    ) = result.one()
+    # Every review rates all three categories; average the unrounded values
+    overall_average = (
+        (avg_item_accuracy + avg_communication + avg_punctuality) / 3
+        if total_reviews
+        else None
+    )
+
+    # Individual reviews are only loaded once the grace period is over
     review_list = None
     if reviews_visible:
-        review_list = [_review_to_response(r) for r in reviews]
+        result = await db.execute(
+            select(MarketplaceReview)
+            .options(
+                joinedload(MarketplaceReview.reviewer).load_only(*USER_MINIMAL_COLUMNS),
+                joinedload(MarketplaceReview.reviewee).load_only(*USER_MINIMAL_COLUMNS),
+            )
+            .where(MarketplaceReview.reviewee_id == user_uuid)
+            .order_by(MarketplaceReview.created_at.desc())
+        )
+        review_list = [_review_to_response(r) for r in result.scalars().all()]
 
     return MarketplaceReputationResponse(
         user_id=user_id,
@@ -706,18 +710,24 @@ async def admin_list_listings(
     per_page: Annotated[int, Query(ge=1, le=100)] = 50,
 ):
     """List all marketplace listings (admin only)."""
+    # Only the columns this table renders; skips description, images, etc.
     query = (
         select(MarketplaceListing)
-        .options(selectinload(MarketplaceListing.seller))
+        .options(
+            load_only(
+                MarketplaceListing.title,
+                MarketplaceListing.price,
+                MarketplaceListing.category,
+                MarketplaceListing.status,
+                MarketplaceListing.created_at,
+                MarketplaceListing.user_id,
+            ),
+            selectinload(MarketplaceListing.seller).load_only(User.id, User.name),
+        )
         .order_by(MarketplaceListing.created_at.desc())
     )
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    query = query.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(query)
-    listings = result.scalars().all()
+    listings, total = await fetch_page(db, query, page, per_page)
 
     return {
         "items": [
@@ -7,13 +7,25 @@ logger = logging.getLogger(__name__)
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, UploadFile, File
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import CurrentUser, VerifiedUser
+from app.models.base import uuid7
 from app.models.messaging import Conversation, ConversationStatus, Message
 from app.models.user import User
 from app.schemas.messaging import (
@@ -163,58 +175,86 @@ def _message_to_response(message: Message) -> MessageResponse:
     )
 
 
-async def _get_conversation_response(
-    conv: Conversation,
+async def _get_conversation_responses(
+    convs: list[Conversation],
     current_user_id: uuid.UUID,
     db: AsyncSession,
-) -> ConversationResponse:
-    """Convert conversation model to response with participants array format."""
-    # Build participants list
-    participants = [
-        ParticipantInfo(
-            id=str(conv.user1.id),
-            name=conv.user1.name or "Unknown",
-            avatar_url=conv.user1.avatar_url,
-        ),
-        ParticipantInfo(
-            id=str(conv.user2.id),
-            name=conv.user2.name or "Unknown",
-            avatar_url=conv.user2.avatar_url,
-        ),
-    ]
-
-    # Get last message
+) -> list[ConversationResponse]:
+    """Convert conversations to responses, batching the per-conversation lookups.
+
+    Last messages and unread counts for the whole page are fetched with one
+    query each instead of two queries per conversation.
+    """
+    if not convs:
+        return []
+    conv_ids = [conv.id for conv in convs]
+
+    # Latest message per conversation (DISTINCT ON walks ix_messages_conv_created)
     last_msg_result = await db.execute(
         select(Message)
-        .where(Message.conversation_id == conv.id)
-        .order_by(Message.created_at.desc())
-        .limit(1)
+        .options(selectinload(Message.reply_to))
+        .where(Message.conversation_id.in_(conv_ids))
+        .order_by(Message.conversation_id, Message.created_at.desc())
+        .ext(distinct_on(Message.conversation_id))
     )
-    last_message = last_msg_result.scalar_one_or_none()
+    last_messages = {m.conversation_id: m for m in last_msg_result.scalars().all()}
 
     # Count unread messages (messages from the other user that haven't been read)
     unread_result = await db.execute(
-        select(func.count())
-        .select_from(Message)
-        .where(Message.conversation_id == conv.id)
+        select(Message.conversation_id, func.count())
+        .where(Message.conversation_id.in_(conv_ids))
         .where(Message.sender_id != current_user_id)
         .where(Message.read_at.is_(None))
+        .group_by(Message.conversation_id)
     )
-    unread_count = unread_result.scalar() or 0
-
-    return ConversationResponse(
-        id=str(conv.id),
-        participants=participants,
-        initiator_id=str(conv.initiated_by),
-        status=conv.status,
-        last_message=_message_to_response(last_message) if last_message else None,
-        last_message_at=last_message.created_at if last_message else None,
-        unread_count=unread_count,
-        context_type=conv.context_type,
-        context_id=str(conv.context_id) if conv.context_id else None,
-        created_at=conv.created_at,
-        updated_at=conv.updated_at,
-    )
+    unread_counts = dict(unread_result.tuples().all())
+
+    responses = []
+    for conv in convs:
+        # Build participants list
+        participants = [
+            ParticipantInfo(
+                id=str(conv.user1.id),
+                name=conv.user1.name or "Unknown",
+                avatar_url=conv.user1.avatar_url,
+            ),
+            ParticipantInfo(
+                id=str(conv.user2.id),
+                name=conv.user2.name or "Unknown",
+                avatar_url=conv.user2.avatar_url,
+            ),
+        ]
+        last_message = last_messages.get(conv.id)
+
+        responses.append(
+            ConversationResponse(
+                id=str(conv.id),
+                participants=participants,
+                initiator_id=str(conv.initiated_by),
+                status=conv.status,
+                last_message=(
+                    _message_to_response(last_message) if last_message else None
+                ),
+                last_message_at=conv.last_message_at,
+                unread_count=unread_counts.get(conv.id, 0),
+                context_type=conv.context_type,
+                context_id=str(conv.context_id) if conv.context_id else None,
+                created_at=conv.created_at,
+                updated_at=conv.updated_at,
+            )
+        )
+
+    return responses
+
+
+async def _get_conversation_response(
+    conv: Conversation,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+) -> ConversationResponse:
+    """Convert conversation model to response with participants array format."""
+    (response,) = await _get_conversation_responses([conv], current_user_id, db)
+    return response
 
 
 @router.get("/conversations", response_model=ConversationListResponse)
@@ -260,20 +300,22 @@ async def list_conversations(
     total_result = await db.execute(count_query)
     total = total_result.scalar() or 0
 
-    query = query.order_by(Conversation.updated_at.desc())
+    query = query.order_by(
+        Conversation.last_message_at.desc().nulls_last(),
+        Conversation.updated_at.desc(),
+    )
     query = query.offset((page - 1) * per_page).limit(per_page)
 
     result = await db.execute(query)
     conversations = result.scalars().all()
 
-    items = []
-    for conv in conversations:
-        items.append(await _get_conversation_response(conv, user.id, db))
+    items = await _get_conversation_responses(list(conversations), user.id, db)
 
-    return ConversationListResponse(
+    payload = ConversationListResponse(
         items=items,
         total=total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/requests", response_model=PendingRequestsResponse)
@@ -302,9 +344,7 @@ async def list_pending_requests(
     result = await db.execute(query)
     conversations = result.scalars().all()
 
-    requests = []
-    for conv in conversations:
-        requests.append(await _get_conversation_response(conv, user.id, db))
+    requests = await _get_conversation_responses(list(conversations), user.id, db)
 
     return PendingRequestsResponse(requests=requests)
 
@@ -328,25 +368,19 @@ async def start_conversation(
     if not recipient:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Check for existing conversation (in either direction)
+    # Pairs are stored in canonical order (user1_id < user2_id), so one probe
+    # of ix_conversations_users finds an existing conversation either way
+    user1_id, user2_id = sorted((user.id, recipient_id))
+
+    # Check for existing conversation
     existing = await db.execute(
         select(Conversation)
         .options(
             selectinload(Conversation.user1),
             selectinload(Conversation.user2),
         )
-        .where(
-            or_(
-                and_(
-                    Conversation.user1_id == user.id,
-                    Conversation.user2_id == recipient_id,
-                ),
-                and_(
-                    Conversation.user1_id == recipient_id,
-                    Conversation.user2_id == user.id,
-                ),
-            )
-        )
+        .where(Conversation.user1_id == user1_id)
+        .where(Conversation.user2_id == user2_id)
     )
     existing_conv = existing.scalar_one_or_none()
 
@@ -359,8 +393,8 @@ async def start_conversation(
     # Create new conversation
     conversation = Conversation(
         id=uuid.uuid4(),
-        user1_id=user.id,
-        user2_id=recipient_id,
+        user1_id=user1_id,
+        user2_id=user2_id,
         initiated_by=user.id,
         status=ConversationStatus.PENDING,
         context_type=request.context_type,
@@ -372,13 +406,15 @@ async def start_conversation(
 
     # Create initial message
     message = Message(
-        id=uuid.uuid4(),
+        id=uuid7(),
         conversation_id=conversation.id,
         sender_id=user.id,
         content=request.initial_message,
     )
 
     db.add(message)
+    # now() is the transaction timestamp, so this matches message.created_at
+    conversation.last_message_at = func.now()
     await db.commit()
 
     # Reload with relationships
@@ -469,7 +505,7 @@ async def get_messages(
     # Build query for messages with reply_to relationship
     query = (
         select(Message)
-        .options(selectinload(Message.reply_to))
+        .options(selectinload(Message.reply_to), raiseload("*"))
         .where(Message.conversation_id == conversation.id)
     )
 
@@ -497,10 +533,13 @@ async def get_messages(
     # Reverse to get chronological order (oldest first)
     messages = list(reversed(messages))
 
-    return MessageListResponse(
+    # Serialize straight to JSON; FastAPI would otherwise re-validate and
+    # dump the already-built response model field by field
+    payload = MessageListResponse(
         messages=[_message_to_response(m) for m in messages],
         has_more=has_more,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/conversations/{conversation_id}/messages", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
@@ -537,7 +576,7 @@ async def send_message(
             raise HTTPException(status_code=403, detail="Accept the request first")
 
     message = Message(
-        id=uuid.uuid4(),
+        id=uuid7(),
         conversation_id=conversation.id,
         sender_id=user.id,
         content=request.content,
@@ -547,8 +586,9 @@ async def send_message(
 
     db.add(message)
 
-    # Update conversation timestamp
+    # Update conversation timestamps (now() matches message.created_at)
     conversation.updated_at = datetime.now(timezone.utc)
+    conversation.last_message_at = func.now()
 
     await db.commit()
 
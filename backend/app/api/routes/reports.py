@@ -4,13 +4,14 @@ import uuid
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.core.database import get_db
 from app.core.dependencies import AdminUser, VerifiedUser
+from app.core.pagination import fetch_page
 from app.models.report import ReportReason, ReportStatus, UserReport
 from app.models.user import User
 from app.schemas.report import (
@@ -20,7 +21,7 @@ from app.schemas.report import (
     ReportListResponse,
     ReportResponse,
 )
-from app.schemas.user import UserMinimal
+from app.schemas.user import USER_MINIMAL_COLUMNS, user_minimal
 
 router = APIRouter(tags=["Reports"])
 
@@ -29,24 +30,12 @@ def _report_to_admin_response(report: UserReport) -> ReportAdminResponse:
     """Convert report model to admin response."""
     resolved_by_admin = None
     if report.resolved_by_admin:
-        resolved_by_admin = UserMinimal(
-            id=str(report.resolved_by_admin.id),
-            name=report.resolved_by_admin.name,
-            avatar_url=report.resolved_by_admin.avatar_url,
-        )
+        resolved_by_admin = user_minimal(report.resolved_by_admin)
 
     return ReportAdminResponse(
         id=str(report.id),
-        reporter=UserMinimal(
-            id=str(report.reporter.id),
-            name=report.reporter.name,
-            avatar_url=report.reporter.avatar_url,
-        ),
-        reported_user=UserMinimal(
-            id=str(report.reported_user.id),
-            name=report.reported_user.name,
-            avatar_url=report.reported_user.avatar_url,
-        ),
+        reporter=user_minimal(report.reporter),
+        reported_user=user_minimal(report.reported_user),
         reason=report.reason,
         explanation=report.explanation,
         status=report.status,
@@ -123,9 +112,9 @@ async def list_reports(
     query = (
         select(UserReport)
         .options(
-            selectinload(UserReport.reporter),
-            selectinload(UserReport.reported_user),
-            selectinload(UserReport.resolved_by_admin),
+            joinedload(UserReport.reporter).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.reported_user).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.resolved_by_admin).load_only(*USER_MINIMAL_COLUMNS),
         )
     )
 
@@ -135,24 +124,18 @@ async def list_reports(
     if reason_filter:
         query = query.where(UserReport.reason == reason_filter)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Paginate - newest first
     query = query.order_by(UserReport.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
+    reports, total = await fetch_page(db, query, page, per_page)
 
-    result = await db.execute(query)
-    reports = result.scalars().all()
-
-    return ReportListResponse(
+    payload = ReportListResponse(
         items=[_report_to_admin_response(r) for r in reports],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.patch("/admin/reports/{report_id}", response_model=ReportAdminResponse)
@@ -173,9 +156,9 @@ async def update_report(
     result = await db.execute(
         select(UserReport)
         .options(
-            selectinload(UserReport.reporter),
-            selectinload(UserReport.reported_user),
-            selectinload(UserReport.resolved_by_admin),
+            joinedload(UserReport.reporter).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.reported_user).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.resolved_by_admin).load_only(*USER_MINIMAL_COLUMNS),
         )
         .where(UserReport.id == report_uuid)
     )
@@ -204,9 +187,9 @@ async def update_report(
     result = await db.execute(
         select(UserReport)
         .options(
-            selectinload(UserReport.reporter),
-            selectinload(UserReport.reported_user),
-            selectinload(UserReport.resolved_by_admin),
+            joinedload(UserReport.reporter).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.reported_user).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.resolved_by_admin).load_only(*USER_MINIMAL_COLUMNS),
         )
         .where(UserReport.id == report_uuid)
     )
@@ -232,9 +215,9 @@ async def get_report(
     result = await db.execute(
         select(UserReport)
         .options(
-            selectinload(UserReport.reporter),
-            selectinload(UserReport.reported_user),
-            selectinload(UserReport.resolved_by_admin),
+            joinedload(UserReport.reporter).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.reported_user).load_only(*USER_MINIMAL_COLUMNS),
+            joinedload(UserReport.resolved_by_admin).load_only(*USER_MINIMAL_COLUMNS),
         )
         .where(UserReport.id == report_uuid)
     )
@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, select, delete
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, func, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -166,7 +166,8 @@ async def list_residences(db: Annotated[AsyncSession, Depends(get_db)]):
         else:
             glendon.append(resp)
 
-    return ResidenceListResponse(keele=keele, glendon=glendon)
+    payload = ResidenceListResponse(keele=keele, glendon=glendon).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 # ============ Membership ============
@@ -244,9 +245,19 @@ async def join_residence(
         channel_id=channel.id,
         last_read_at=datetime.now(timezone.utc),
     ))
-    # Increment counts
-    residence.member_count = (residence.member_count or 0) + 1
-    channel.member_count = (channel.member_count or 0) + 1
+    # Increment counts in SQL so concurrent joins are not lost
+    await db.execute(
+        update(Residence)
+        .where(Residence.id == residence.id)
+        .values(member_count=func.coalesce(Residence.member_count, 0) + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(ResidenceChannel)
+        .where(ResidenceChannel.id == channel.id)
+        .values(member_count=func.coalesce(ResidenceChannel.member_count, 0) + 1)
+        .execution_options(synchronize_session=False)
+    )
 
     await db.commit()
     await db.refresh(residence)
@@ -297,10 +308,22 @@ async def leave_residence(
                 )
             )
         )
-        channel.member_count = max(0, (channel.member_count or 1) - 1)
+        await db.execute(
+            update(ResidenceChannel)
+            .where(ResidenceChannel.id == channel.id)
+            .where(ResidenceChannel.member_count > 0)
+            .values(member_count=ResidenceChannel.member_count - 1)
+            .execution_options(synchronize_session=False)
+        )
 
     await db.delete(member)
-    residence.member_count = max(0, (residence.member_count or 1) - 1)
+    await db.execute(
+        update(Residence)
+        .where(Residence.id == residence.id)
+        .where(Residence.member_count > 0)
+        .values(member_count=Residence.member_count - 1)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
 
     return LeaveResidenceResponse(message=f"Left {residence.name}")
@@ -382,7 +405,8 @@ async def get_messages(
         await db.commit()
 
     messages = [_message_to_response(m, m.user) for m in reversed(msgs)]
-    return ResidenceMessageListResponse(messages=messages, has_more=has_more)
+    payload = ResidenceMessageListResponse(messages=messages, has_more=has_more).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/channels/{channel_id}/messages", response_model=ResidenceMessageResponse)
@@ -3,10 +3,10 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.core.database import get_db
 from app.core.dependencies import CurrentUser, VerifiedUser
@@ -18,7 +18,7 @@ from app.schemas.review import (
     ReviewResponse,
     UserRatingSummary,
 )
-from app.schemas.user import UserMinimal
+from app.schemas.user import USER_MINIMAL_COLUMNS, user_minimal
 
 router = APIRouter(prefix="/reviews", tags=["Reviews"])
 
@@ -27,11 +27,7 @@ def _review_to_response(review: Review) -> ReviewResponse:
     """Convert review model to response."""
     return ReviewResponse(
         id=str(review.id),
-        reviewer=UserMinimal(
-            id=str(review.reviewer.id),
-            name=review.reviewer.name,
-            avatar_url=review.reviewer.avatar_url,
-        ),
+        reviewer=user_minimal(review.reviewer),
         rating=review.rating,
         comment=review.comment,
         review_type=review.review_type,
@@ -98,7 +94,7 @@ async def get_user_reviews(
     """Get reviews for a user."""
     query = (
         select(Review)
-        .options(selectinload(Review.reviewer))
+        .options(joinedload(Review.reviewer).load_only(*USER_MINIMAL_COLUMNS))
         .where(Review.reviewed_id == user_id)
     )
 
@@ -123,11 +119,12 @@ async def get_user_reviews(
     result = await db.execute(query)
     reviews = result.scalars().all()
 
-    return ReviewListResponse(
+    payload = ReviewListResponse(
         items=[_review_to_response(r) for r in reviews],
         total=total,
         average_rating=round(average_rating, 1),
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/user/{user_id}/summary", response_model=UserRatingSummary)
@@ -195,13 +192,13 @@ async def get_my_reviews(
     if direction == "given":
         query = (
             select(Review)
-            .options(selectinload(Review.reviewer))
+            .options(joinedload(Review.reviewer).load_only(*USER_MINIMAL_COLUMNS))
             .where(Review.reviewer_id == user.id)
         )
     else:
         query = (
             select(Review)
-            .options(selectinload(Review.reviewer))
+            .options(joinedload(Review.reviewer).load_only(*USER_MINIMAL_COLUMNS))
             .where(Review.reviewed_id == user.id)
         )
 
@@ -224,11 +221,12 @@ async def get_my_reviews(
     result = await db.execute(query)
     reviews = result.scalars().all()
 
-    return ReviewListResponse(
+    payload = ReviewListResponse(
         items=[_review_to_response(r) for r in reviews],
         total=total,
         average_rating=round(average_rating, 1),
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -4,13 +4,14 @@ import uuid
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import CurrentUser, VerifiedUser
+from app.core.pagination import fetch_page
 from app.models.marketplace import ListingStatus, MarketplaceListing
 from app.models.transaction import MarketplaceTransaction
 from app.models.user import User
@@ -19,27 +20,19 @@ from app.schemas.transaction import (
     TransactionListResponse,
     TransactionResponse,
 )
-from app.schemas.user import UserMinimal
+from app.schemas.user import user_minimal
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
 
 def _transaction_to_response(txn: MarketplaceTransaction) -> TransactionResponse:
-    """Convert transaction model to response."""
-    return TransactionResponse(
+    """Convert transaction model to response (trusted DB row, so no validation)."""
+    return TransactionResponse.model_construct(
         id=str(txn.id),
         listing_id=str(txn.listing_id),
         listing_title=txn.listing.title,
-        seller=UserMinimal(
-            id=str(txn.seller.id),
-            name=txn.seller.name,
-            avatar_url=txn.seller.avatar_url,
-        ),
-        buyer=UserMinimal(
-            id=str(txn.buyer.id),
-            name=txn.buyer.name,
-            avatar_url=txn.buyer.avatar_url,
-        ),
+        seller=user_minimal(txn.seller),
+        buyer=user_minimal(txn.buyer),
         final_price=txn.final_price,
         seller_confirmed=txn.seller_confirmed,
         buyer_confirmed=txn.buyer_confirmed,
@@ -186,24 +179,18 @@ async def get_my_transactions(
     elif completed is False:
         query = query.where(MarketplaceTransaction.completed_at.is_(None))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Paginate
     query = query.order_by(MarketplaceTransaction.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    transactions = result.scalars().all()
+    transactions, total = await fetch_page(db, query, page, per_page)
 
-    return TransactionListResponse(
+    payload = TransactionListResponse.model_construct(
         items=[_transaction_to_response(t) for t in transactions],
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{transaction_id}/confirm", response_model=TransactionResponse)
@@ -274,14 +261,6 @@ async def confirm_transaction(
         # Update listing status to SOLD
         transaction.listing.status = ListingStatus.SOLD
 
-        # Increment completed_transactions for both users
-        seller = await db.get(User, transaction.seller_id)
-        buyer = await db.get(User, transaction.buyer_id)
-        if seller:
-            seller.completed_transactions += 1
-        if buyer:
-            buyer.completed_transactions += 1
-
     await db.commit()
 
     # Refresh
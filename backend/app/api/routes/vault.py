@@ -4,15 +4,32 @@ import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import func, select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import and_, case, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, raiseload, selectinload
 
 from app.core.database import get_db
-from app.core.dependencies import AdminUser, CurrentUser, CurrentUserOptional, VerifiedUser
-from app.models.vault import VaultPost, VaultComment, VaultPostStatus, VaultCategory
+from app.core.dependencies import (
+    AdminUser,
+    CurrentUser,
+    CurrentUserOptional,
+    VerifiedUser,
+)
+from app.core.pagination import fetch_page
 from app.models.user import User
+from app.models.vault import VaultCategory, VaultComment, VaultPost, VaultPostStatus
+from app.schemas.user import user_minimal
 from app.schemas.vault import (
     FlagRequest,
     VaultCommentCreate,
@@ -24,8 +41,8 @@ from app.schemas.vault import (
     VaultPostResponse,
     VaultPostUpdate,
 )
-from app.schemas.user import UserMinimal
 from app.services.gemini import gemini_service
+from app.services.redis import PageCache, redis_service
 from app.services.storage import storage_service
 
 logger = logging.getLogger(__name__)
@@ -35,16 +52,15 @@ router = APIRouter(prefix="/vault", tags=["Vault"])
 # Constants
 FLAG_THRESHOLD = 5  # Posts hidden after this many flags
 
+# The feed is identical for every viewer; cache pages briefly in Redis
+_list_cache = PageCache(redis_service, "vault", ttl_seconds=15)
+
 
 def _post_to_response(post: VaultPost, current_user_id: str | None = None) -> VaultPostResponse:
     """Convert post model to response, hiding author if anonymous."""
     author = None
     if not post.is_anonymous:
-        author = UserMinimal(
-            id=str(post.author.id),
-            name=post.author.name,
-            avatar_url=post.author.avatar_url,
-        )
+        author = user_minimal(post.author)
 
     return VaultPostResponse(
         id=str(post.id),
@@ -67,11 +83,7 @@ def _comment_to_response(comment: VaultComment) -> VaultCommentResponse:
     """Convert comment model to response, hiding author if anonymous."""
     author = None
     if not comment.is_anonymous:
-        author = UserMinimal(
-            id=str(comment.author.id),
-            name=comment.author.name,
-            avatar_url=comment.author.avatar_url,
-        )
+        author = user_minimal(comment.author)
 
     return VaultCommentResponse(
         id=str(comment.id),
@@ -130,35 +142,67 @@ async def list_posts(
     per_page: Annotated[int, Query(ge=1, le=50)] = 20,
 ):
     """List vault posts with optional category filter."""
+    # The feed is identical for every viewer, so serve it from Redis when possible
+    cache_key = None
+    try:
+        cache_key = await _list_cache.key(category.value if category else 'all', page, per_page)
+        cached = await _list_cache.get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+    except Exception as e:
+        logger.warning("Vault list cache read failed: %s", e)
+        cache_key = None
+
     query = (
         select(VaultPost)
-        .options(selectinload(VaultPost.author))
+        .options(selectinload(VaultPost.author), raiseload("*"))
         .where(VaultPost.status == VaultPostStatus.ACTIVE)
     )
 
     if category:
         query = query.where(VaultPost.category == category)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
     # Paginate
     query = query.order_by(VaultPost.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    posts = result.scalars().all()
-
-    current_user_id = str(user.id) if user else None
+    posts, total = await fetch_page(db, query, page, per_page)
+
+    # Rows come straight from the DB, so skip validation and bind the
+    # constructor locally instead of calling _post_to_response per row.
+    post_response = VaultPostResponse.model_construct
+    items = [
+        post_response(
+            id=str(p.id),
+            title=p.title,
+            content=p.content,
+            category=p.category,
+            is_anonymous=p.is_anonymous,
+            status=p.status,
+            comment_count=p.comment_count,
+            upvote_count=p.upvote_count,
+            flag_count=p.flag_count,
+            images=p.images,
+            author=None if p.is_anonymous else user_minimal(p.author),
+            created_at=p.created_at,
+            updated_at=p.updated_at,
+        )
+        for p in posts
+    ]
 
-    return VaultPostListResponse(
-        items=[_post_to_response(p, current_user_id) for p in posts],
+    payload = VaultPostListResponse(
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
-    )
+    ).model_dump_json()
+
+    if cache_key:
+        try:
+            await _list_cache.set(cache_key, payload)
+        except Exception as e:
+            logger.warning("Vault list cache write failed: %s", e)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=VaultPostResponse, status_code=status.HTTP_201_CREATED)
@@ -198,6 +242,7 @@ async def create_post(
     db.add(post)
     await db.commit()
     await db.refresh(post, ["author"])
+    await _list_cache.invalidate()
 
     from app.services import push_service
 
@@ -271,6 +316,7 @@ async def update_post(
 
     await db.commit()
     await db.refresh(post)
+    await _list_cache.invalidate()
 
     return _post_to_response(post, str(user.id))
 
@@ -283,7 +329,9 @@ async def delete_post(
 ):
     """Delete a vault post (author only)."""
     result = await db.execute(
-        select(VaultPost).where(VaultPost.id == post_id)
+        select(VaultPost)
+        .options(defer(VaultPost.content))
+        .where(VaultPost.id == post_id)
     )
     post = result.scalar_one_or_none()
 
@@ -295,6 +343,7 @@ async def delete_post(
 
     post.status = VaultPostStatus.DELETED
     await db.commit()
+    await _list_cache.invalidate()
 
 
 @router.post("/{post_id}/flag", status_code=status.HTTP_204_NO_CONTENT)
@@ -305,22 +354,31 @@ async def flag_post(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Flag a post for moderation."""
+    # Increment flag count and auto-hide at the threshold in one statement,
+    # so concurrent flags cannot overwrite each other's increment
+    status_type = VaultPost.__table__.c.status.type
     result = await db.execute(
-        select(VaultPost).where(VaultPost.id == post_id)
+        update(VaultPost)
+        .where(VaultPost.id == post_id)
+        .values(
+            flag_count=VaultPost.flag_count + 1,
+            status=case(
+                (
+                    VaultPost.flag_count + 1 >= FLAG_THRESHOLD,
+                    literal(VaultPostStatus.HIDDEN, status_type),
+                ),
+                else_=VaultPost.status,
+            ),
+        )
+        .returning(VaultPost.id)
+        .execution_options(synchronize_session=False)
     )
-    post = result.scalar_one_or_none()
 
-    if not post:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    # Increment flag count
-    post.flag_count += 1
-
-    # Auto-hide if threshold reached
-    if post.flag_count >= FLAG_THRESHOLD:
-        post.status = VaultPostStatus.HIDDEN
-
     await db.commit()
+    await _list_cache.invalidate()
 
 
 # Comments endpoints
@@ -332,26 +390,32 @@ async def list_comments(
     user: CurrentUserOptional,
 ):
     """List comments on a post."""
-    # Verify post exists
-    post_result = await db.execute(
-        select(VaultPost).where(VaultPost.id == post_id)
-    )
-    if not post_result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Post not found")
-
+    # Outer join from the post: one round-trip both verifies the post exists
+    # (no rows -> 404) and returns its visible comments (NULL row if none).
     result = await db.execute(
-        select(VaultComment)
-        .options(selectinload(VaultComment.author))
-        .where(VaultComment.post_id == post_id)
-        .where(VaultComment.is_hidden == False)
+        select(VaultPost.id, VaultComment)
+        .outerjoin(
+            VaultComment,
+            and_(
+                VaultComment.post_id == VaultPost.id,
+                VaultComment.is_hidden == False,
+            ),
+        )
+        .options(selectinload(VaultComment.author), raiseload("*"))
+        .where(VaultPost.id == post_id)
         .order_by(VaultComment.created_at.asc())
     )
-    comments = result.scalars().all()
+    rows = result.all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    comments = [comment for _, comment in rows if comment is not None]
 
-    return VaultCommentListResponse(
+    payload = VaultCommentListResponse(
         items=[_comment_to_response(c) for c in comments],
         total=len(comments),
-    )
+    ).model_dump_json()
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{post_id}/comments", response_model=VaultCommentResponse, status_code=status.HTTP_201_CREATED)
@@ -364,7 +428,9 @@ async def create_comment(
     """Create a comment on a post."""
     # Verify post exists and is active
     post_result = await db.execute(
-        select(VaultPost).where(VaultPost.id == post_id)
+        select(VaultPost)
+        .options(defer(VaultPost.content))
+        .where(VaultPost.id == post_id)
     )
     post = post_result.scalar_one_or_none()
 
@@ -374,7 +440,7 @@ async def create_comment(
     # Verify parent comment if provided
     if request.parent_id:
         parent_result = await db.execute(
-            select(VaultComment).where(VaultComment.id == request.parent_id)
+            select(VaultComment.id).where(VaultComment.id == request.parent_id)
         )
         if not parent_result.scalar_one_or_none():
             raise HTTPException(status_code=400, detail="Parent comment not found")
@@ -399,7 +465,12 @@ async def create_comment(
     db.add(comment)
 
     # Update comment count on post
-    post.comment_count += 1
+    await db.execute(
+        update(VaultPost)
+        .where(VaultPost.id == post.id)
+        .values(comment_count=VaultPost.comment_count + 1)
+        .execution_options(synchronize_session=False)
+    )
 
     await db.commit()
     await db.refresh(comment, ["author"])
@@ -417,6 +488,7 @@ async def delete_comment(
     """Delete a comment (author only)."""
     result = await db.execute(
         select(VaultComment)
+        .options(defer(VaultComment.content))
         .where(VaultComment.id == comment_id)
         .where(VaultComment.post_id == post_id)
     )
@@ -428,16 +500,15 @@ async def delete_comment(
     if str(comment.user_id) != str(user.id):
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Soft delete by hiding
-    comment.is_hidden = True
-
-    # Update comment count on post
-    post_result = await db.execute(
-        select(VaultPost).where(VaultPost.id == post_id)
-    )
-    post = post_result.scalar_one_or_none()
-    if post:
-        post.comment_count = max(0, post.comment_count - 1)
+    # Soft delete by hiding; only the first delete gives back the count
+    if not comment.is_hidden:
+        comment.is_hidden = True
+        await db.execute(
+            update(VaultPost)
+            .where(VaultPost.id == comment.post_id)
+            .values(comment_count=func.greatest(VaultPost.comment_count - 1, 0))
+            .execution_options(synchronize_session=False)
+        )
 
     await db.commit()
 
@@ -455,16 +526,11 @@ async def admin_list_posts(
     """List all vault posts including deleted (admin only)."""
     query = (
         select(VaultPost)
-        .options(selectinload(VaultPost.author))
+        .options(selectinload(VaultPost.author), raiseload("*"))
         .order_by(VaultPost.created_at.desc())
     )
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    query = query.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(query)
-    posts = result.scalars().all()
+    posts, total = await fetch_page(db, query, page, per_page)
 
     return {
         "items": [
@@ -500,7 +566,7 @@ async def admin_list_comments(
     """List all comments for a post with real author names (admin only)."""
     result = await db.execute(
         select(VaultComment)
-        .options(selectinload(VaultComment.author))
+        .options(selectinload(VaultComment.author), raiseload("*"))
         .where(VaultComment.post_id == post_id)
         .order_by(VaultComment.created_at.asc())
     )
@@ -529,7 +595,11 @@ async def admin_delete_post(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Force-delete any vault post (admin only)."""
-    result = await db.execute(select(VaultPost).where(VaultPost.id == post_id))
+    result = await db.execute(
+        select(VaultPost)
+        .options(defer(VaultPost.content))
+        .where(VaultPost.id == post_id)
+    )
     post = result.scalar_one_or_none()
 
     if not post:
@@ -537,3 +607,4 @@ async def admin_delete_post(
 
     post.status = VaultPostStatus.DELETED
     await db.commit()
+    await _list_cache.invalidate()
@@ -76,6 +76,11 @@ class Settings(BaseSettings):
     rate_limit_whitelist_ips: str = ""         # Comma-separated IPs exempt from all rate limits
     blocked_ips: str = ""                      # Comma-separated IPs permanently blocked (403)
 
+    # Background jobs
+    # Run the hourly quest cleanup inside the API process. Turn off only where the
+    # dedicated worker (python -m app.workers.quest_cleanup_worker) is deployed.
+    quest_cleanup_in_process: bool = True
+
 
 @lru_cache
 def get_settings() -> Settings:
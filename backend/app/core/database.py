@@ -13,6 +13,7 @@ engine = create_async_engine(
     max_overflow=10,
     pool_timeout=30,  # Wait up to 30s for connection from pool
     pool_recycle=1800,  # Recycle connections after 30 minutes
+    query_cache_size=1200,  # Compiled-statement cache (default 500)
     connect_args={
         "statement_cache_size": 0,  # Required for Supabase transaction pooler (pgbouncer)
         "command_timeout": 30,  # Query timeout in seconds
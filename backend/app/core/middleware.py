@@ -39,7 +39,16 @@ AUTH_ENDPOINTS = {
 }
 
 # Health check is always exempt — ALB probes should never be rate-limited.
-EXEMPT_ENDPOINTS = {"/api/v1/health"}
+EXEMPT_ENDPOINTS = frozenset({f"{settings.api_prefix}/health"})
+
+# Only API routes are rate limited; docs, openapi.json and "/" skip Redis
+# (the IP blocklist still applies to them).
+RATE_LIMITED_PREFIX = settings.api_prefix
+
+# Prebuilt response bodies for rejected requests
+_BLOCKED_BODY = b'{"detail": "Access denied."}'
+_AUTH_RATE_LIMIT_BODY = b'{"detail": "Too many requests. Please wait before trying again."}'
+_RATE_LIMIT_BODY = b'{"detail": "Rate limit exceeded. Please try again later."}'
 
 # In-process fallback for when Redis is unavailable
 _ip_request_counts: dict[str, list[float]] = {}
@@ -130,23 +139,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self._blocklist = _parse_blocklist()
 
     async def dispatch(self, request: Request, call_next) -> Response:
-        real_ip = _get_real_ip(request)
         path = request.url.path
+        real_ip = _get_real_ip(request)
 
-        # Health checks always pass through
-        if path in EXEMPT_ENDPOINTS:
-            return await call_next(request)
-
-        # Permanently blocked IPs — hard 403, no further processing
+        # Permanently blocked IPs — hard 403 on every path, no further processing
         if real_ip in self._blocklist:
             logger.warning("BLOCKED IP REQUEST: ip=%s path=%s", real_ip, path)
             return Response(
-                content='{"detail": "Access denied."}',
+                content=_BLOCKED_BODY,
                 status_code=403,
                 media_type="application/json",
                 headers=_cors_headers(request),
             )
 
+        # Health checks and non-API paths skip the Redis rate limit
+        if path in EXEMPT_ENDPOINTS or not path.startswith(RATE_LIMITED_PREFIX):
+            return await call_next(request)
+
         # Whitelisted IPs bypass all rate limits
         if real_ip in self._whitelist:
             return await call_next(request)
@@ -161,7 +170,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     real_ip, email or "unknown", path, reason,
                 )
                 return Response(
-                    content='{"detail": "Too many requests. Please wait before trying again."}',
+                    content=_AUTH_RATE_LIMIT_BODY,
                     status_code=429,
                     media_type="application/json",
                     headers={"Retry-After": str(settings.rate_limit_auth_window_seconds), **_cors_headers(request)},
@@ -176,7 +185,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 "GLOBAL RATE LIMIT EXCEEDED: ip=%s path=%s", real_ip, path
             )
             return Response(
-                content='{"detail": "Rate limit exceeded. Please try again later."}',
+                content=_RATE_LIMIT_BODY,
                 status_code=429,
                 media_type="application/json",
                 headers={
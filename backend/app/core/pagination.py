@@ -0,0 +1,34 @@
+"""Page-at-a-time fetching for the list endpoints."""
+
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    page: int,
+    per_page: int,
+    unique: bool = False,
+) -> tuple[list[Any], int]:
+    """Run one page of an ORM query and return (entities, total).
+
+    The total rides along on every row as a window count, saving a round trip.
+    A separate COUNT only runs when a page past the first comes back empty.
+    Pass unique=True for queries whose joins can repeat the entity.
+    """
+    paged = (
+        query.offset((page - 1) * per_page)
+        .limit(per_page)
+        .add_columns(func.count().over().label("total"))
+    )
+    result = await db.execute(paged)
+    rows = (result.unique() if unique else result).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if page > 1:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        return [], (await db.execute(count_query)).scalar() or 0
+    return [], 0
@@ -7,63 +7,37 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.logging_config import setup_logging
 
+setup_logging()
 logger = logging.getLogger(__name__)
 from app.core.middleware import RateLimitMiddleware, TimingMiddleware
 from app.api.routes import admin_personas, auth, buddy, courses, dashboard, feedback, gigs, health, map, marketplace, messaging, push_notifications, reports, residences, reviews, transactions, vault
+from app.services.gemini import gemini_service
 from app.services.redis import redis_service
 from app.core.database import async_session_maker
-
-
-async def run_quest_cleanup_task():
-    """Background task to periodically clean up expired quests."""
-    from app.services.quest_cleanup import cleanup_quests
-
-    while True:
-        try:
-            # Run cleanup every hour
-            await asyncio.sleep(3600)  # 1 hour
-
-            async with async_session_maker() as db:
-                result = await cleanup_quests(db)
-                logger.info("Quest cleanup completed: %s", result)
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            logger.error("Quest cleanup error: %s", e)
-            # Wait a bit before retrying on error
-            await asyncio.sleep(60)
-
-
-# Store the background task reference
-cleanup_task: asyncio.Task | None = None
+from app.workers.quest_cleanup_worker import CLEANUP_INTERVAL_SECONDS, cleanup_forever
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    global cleanup_task
-
     # Startup
     logger.info("Starting %s...", settings.app_name)
 
-    # Run initial cleanup on startup (disabled for faster startup)
-    # try:
-    #     from app.services.quest_cleanup import cleanup_quests
-    #     async with async_session_maker() as db:
-    #         result = await cleanup_quests(db)
-    #         print(f"Initial quest cleanup: {result}")
-    # except Exception as e:
-    #     print(f"Initial cleanup failed: {e}")
-
-    # Start background cleanup task
-    cleanup_task = asyncio.create_task(run_quest_cleanup_task())
+    # Quest cleanup normally runs in its own process
+    # (app/workers/quest_cleanup_worker.py); without it, run the loop here,
+    # first pass an hour after boot as before.
+    cleanup_task: asyncio.Task | None = None
+    if settings.quest_cleanup_in_process:
+        cleanup_task = asyncio.create_task(
+            cleanup_forever(async_session_maker, startup_delay=CLEANUP_INTERVAL_SECONDS)
+        )
 
     yield
 
     # Shutdown
     logger.info("Shutting down %s...", settings.app_name)
 
-    # Cancel background task
     if cleanup_task:
         cleanup_task.cancel()
         try:
@@ -72,6 +46,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             pass
 
     await redis_service.close()
+    await gemini_service.close()
 
 
 app = FastAPI(
@@ -1,55 +1,63 @@
 """SQLAlchemy models for YorkPulse."""
 
-from app.models.base import UUIDMixin, TimestampMixin
-from app.models.user import User
-from app.models.vault import VaultPost, VaultComment, VaultCategory, VaultPostStatus
-from app.models.marketplace import (
-    MarketplaceListing,
-    MarketplaceCategory,
-    ListingStatus,
-    ListingCondition,
-)
+from app.models.base import TimestampMixin, UUIDMixin
 from app.models.buddy import (
-    BuddyRequest,
-    BuddyParticipant,
     BuddyCategory,
+    BuddyParticipant,
+    BuddyRequest,
     BuddyRequestStatus,
     ParticipantStatus,
     VibeLevel,
 )
-from app.models.messaging import (
-    Conversation,
-    Message,
-    ConversationStatus,
-)
-from app.models.review import Review, ReviewType
-from app.models.transaction import MarketplaceTransaction
-from app.models.marketplace_review import MarketplaceReview
-from app.models.report import UserReport, ReportReason, ReportStatus
-from app.models.feedback import UserFeedback, FeedbackType, FeedbackStatus
 from app.models.course import (
+    ChannelCreationVote,
+    ChannelMember,
+    ChannelType,
     Course,
     CourseChannel,
     CourseMember,
-    ChannelMember,
     CourseMessage,
-    ChannelCreationVote,
-    ChannelType,
 )
+from app.models.feedback import FeedbackStatus, FeedbackType, UserFeedback
 from app.models.gig import (
     Gig,
-    GigResponse,
-    GigTransaction,
-    GigRating,
-    GigType,
     GigCategory,
-    GigPriceType,
     GigLocation,
-    GigStatus,
+    GigPriceType,
+    GigRating,
+    GigResponse,
     GigResponseStatus,
+    GigStatus,
+    GigTransaction,
     GigTransactionStatus,
+    GigType,
+)
+from app.models.marketplace import (
+    ListingCondition,
+    ListingStatus,
+    MarketplaceCategory,
+    MarketplaceListing,
+)
+from app.models.marketplace_review import MarketplaceReview
+from app.models.messaging import (
+    Conversation,
+    ConversationStatus,
+    Message,
 )
 from app.models.push_subscription import PushSubscription
+from app.models.report import ReportReason, ReportStatus, UserReport
+from app.models.residence import (
+    Residence,
+    ResidenceChannel,
+    ResidenceChannelMember,
+    ResidenceMember,
+    ResidenceMessage,
+)
+from app.models.review import Review, ReviewType
+from app.models.signup_attempt import SignupAttempt
+from app.models.transaction import MarketplaceTransaction
+from app.models.user import User
+from app.models.vault import VaultCategory, VaultComment, VaultPost, VaultPostStatus
 
 __all__ = [
     # Base
@@ -115,4 +123,12 @@ __all__ = [
     "GigTransactionStatus",
     # Push
     "PushSubscription",
+    # Residence
+    "Residence",
+    "ResidenceChannel",
+    "ResidenceMember",
+    "ResidenceChannelMember",
+    "ResidenceMessage",
+    # Signup
+    "SignupAttempt",
 ]
@@ -1,13 +1,28 @@
 import enum
 import uuid
 from datetime import datetime
-
-from sqlalchemy import String, Text, ForeignKey, Integer, DateTime, Boolean, Enum, Float
-from sqlalchemy.dialects.postgresql import UUID
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.user import User
 
 
 class BuddyCategory(str, enum.Enum):
@@ -48,9 +63,13 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
 
     # Activity details
     category: Mapped[BuddyCategory] = mapped_column(
-        Enum(BuddyCategory, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            BuddyCategory,
+            name="buddycategory",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=False,
-        index=True,
     )
     custom_category: Mapped[str | None] = mapped_column(
         String(50),
@@ -67,7 +86,12 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
 
     # Vibe/intensity level
     vibe_level: Mapped[VibeLevel] = mapped_column(
-        Enum(VibeLevel, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            VibeLevel,
+            name="vibelevel",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=VibeLevel.CHILL,
         nullable=False,
     )
@@ -80,7 +104,6 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
     start_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
     end_time: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -91,16 +114,14 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
-    # Map coordinates for York campus
+    # Map coordinates for York campus (radius lookups use ix_buddy_geo)
     latitude: Mapped[float | None] = mapped_column(
         Float,
         nullable=True,
-        index=True,
     )
     longitude: Mapped[float | None] = mapped_column(
         Float,
         nullable=True,
-        index=True,
     )
 
     # Participants (peer_limit in UI, 1-10 people)
@@ -124,7 +145,12 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
 
     # Status
     status: Mapped[BuddyRequestStatus] = mapped_column(
-        Enum(BuddyRequestStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            BuddyRequestStatus,
+            name="buddyrequeststatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=BuddyRequestStatus.OPEN,
         nullable=False,
         index=True,
@@ -146,8 +172,22 @@ class BuddyRequest(Base, UUIDMixin, TimestampMixin):
     participants: Mapped[list["BuddyParticipant"]] = relationship(
         "BuddyParticipant",
         back_populates="buddy_request",
-        lazy="dynamic",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_buddy_open_start",
+            "start_time",
+            postgresql_where=text("status = 'open'"),
+        ),
+        Index("ix_buddy_category_start", "category", "start_time"),
+        Index(
+            "ix_buddy_geo",
+            func.ll_to_earth(text("latitude"), text("longitude")),
+            postgresql_using="gist",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -184,7 +224,12 @@ class BuddyParticipant(Base, UUIDMixin, TimestampMixin):
 
     # Status
     status: Mapped[ParticipantStatus] = mapped_column(
-        Enum(ParticipantStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            ParticipantStatus,
+            name="participantstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=ParticipantStatus.PENDING,
         nullable=False,
     )
@@ -205,7 +250,7 @@ class BuddyParticipant(Base, UUIDMixin, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<BuddyParticipant {self.user_id} - {self.status.value}>"
+        return f"<BuddyParticipant {self.id}>"
 
 
 class QuestMessage(Base, UUIDMixin, TimestampMixin):
@@ -239,6 +284,13 @@ class QuestMessage(Base, UUIDMixin, TimestampMixin):
         nullable=True,
         index=True,
     )
+    # Top-most ancestor of the reply chain, so a whole thread loads in one query
+    thread_root_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("quest_messages.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
     # Soft delete
     is_deleted: Mapped[bool] = mapped_column(
@@ -260,9 +312,15 @@ class QuestMessage(Base, UUIDMixin, TimestampMixin):
         foreign_keys=[reply_to_id],
     )
 
+    __table_args__ = (
+        Index("ix_quest_messages_thread", "quest_id", "thread_root_id", "created_at"),
+        Index(
+            "ix_quest_messages_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<QuestMessage {self.id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
@@ -4,13 +4,13 @@ import enum
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     String,
     Text,
     ForeignKey,
     DateTime,
-    Enum,
     Index,
     Integer,
     Boolean,
@@ -18,12 +18,15 @@ from sqlalchemy import (
     CheckConstraint,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.dialects.postgresql import ENUM, UUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class ChannelType(str, enum.Enum):
     """Type of course channel."""
@@ -97,6 +100,7 @@ class Course(Base, UUIDMixin, TimestampMixin):
 
     __table_args__ = (
         Index("ix_courses_faculty_year", "faculty", "year"),
+        Index("ix_courses_programs_gin", "programs", postgresql_using="gin"),
         CheckConstraint("year >= 1 AND year <= 4", name="ck_courses_year_range"),
     )
 
@@ -120,7 +124,12 @@ class CourseChannel(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
     type: Mapped[ChannelType] = mapped_column(
-        Enum(ChannelType, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            ChannelType,
+            name="channeltype",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=False,
     )
     # Metadata for professor channels: {prof_name, semester, section}
@@ -152,7 +161,7 @@ class CourseChannel(Base, UUIDMixin, TimestampMixin):
         "CourseMessage",
         back_populates="channel",
         cascade="all, delete-orphan",
-        lazy="dynamic",
+        passive_deletes=True,
         order_by="CourseMessage.created_at.desc()",
     )
     channel_members: Mapped[list["ChannelMember"]] = relationship(
@@ -298,6 +307,12 @@ class CourseMessage(Base, UUIDMixin):
 
     __table_args__ = (
         Index("ix_course_messages_channel_created", "channel_id", "created_at"),
+        Index(
+            "ix_course_messages_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         CheckConstraint(
             "message IS NOT NULL OR image_url IS NOT NULL",
             name="ck_course_messages_has_content",
@@ -364,7 +379,3 @@ class ChannelCreationVote(Base, UUIDMixin):
 
     def __repr__(self) -> str:
         return f"<ChannelCreationVote {self.voter_user_id} for {self.prof_name_normalized}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
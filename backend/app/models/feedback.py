@@ -3,20 +3,23 @@
 import enum
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     DateTime,
-    Enum,
     ForeignKey,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class FeedbackType(str, enum.Enum):
     """Type of feedback submission."""
@@ -52,7 +55,12 @@ class UserFeedback(Base, UUIDMixin, TimestampMixin):
 
     # Feedback details
     type: Mapped[FeedbackType] = mapped_column(
-        Enum(FeedbackType, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            FeedbackType,
+            name="feedbacktype",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=False,
         index=True,
     )
@@ -67,7 +75,12 @@ class UserFeedback(Base, UUIDMixin, TimestampMixin):
 
     # Status tracking
     status: Mapped[FeedbackStatus] = mapped_column(
-        Enum(FeedbackStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            FeedbackStatus,
+            name="feedbackstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=FeedbackStatus.PENDING,
         nullable=False,
         index=True,
@@ -91,7 +104,3 @@ class UserFeedback(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<UserFeedback {self.id} - {self.type.value}: {self.subject[:30]}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
@@ -2,13 +2,27 @@ import enum
 import uuid
 from datetime import datetime
 from decimal import Decimal
-
-from sqlalchemy import String, Text, ForeignKey, Integer, DateTime, Boolean, Enum, Numeric
-from sqlalchemy.dialects.postgresql import UUID
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.user import User
 
 
 class GigType(str, enum.Enum):
@@ -80,14 +94,24 @@ class Gig(Base, UUIDMixin, TimestampMixin):
 
     # Gig type (offering vs need_help)
     gig_type: Mapped[GigType] = mapped_column(
-        Enum(GigType, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigType,
+            name="gigtype",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=False,
         index=True,
     )
 
     # Category
     category: Mapped[GigCategory] = mapped_column(
-        Enum(GigCategory, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigCategory,
+            name="gigcategory",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=False,
         index=True,
     )
@@ -112,13 +136,23 @@ class Gig(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
     price_type: Mapped[GigPriceType | None] = mapped_column(
-        Enum(GigPriceType, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigPriceType,
+            name="gigpricetype",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=True,
     )
 
     # Location
     location: Mapped[GigLocation | None] = mapped_column(
-        Enum(GigLocation, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigLocation,
+            name="giglocation",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         nullable=True,
     )
     location_details: Mapped[str | None] = mapped_column(
@@ -134,7 +168,12 @@ class Gig(Base, UUIDMixin, TimestampMixin):
 
     # Status
     status: Mapped[GigStatus] = mapped_column(
-        Enum(GigStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigStatus,
+            name="gigstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=GigStatus.ACTIVE,
         nullable=False,
         index=True,
@@ -160,13 +199,22 @@ class Gig(Base, UUIDMixin, TimestampMixin):
     responses: Mapped[list["GigResponse"]] = relationship(
         "GigResponse",
         back_populates="gig",
-        lazy="dynamic",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     transactions: Mapped[list["GigTransaction"]] = relationship(
         "GigTransaction",
         back_populates="gig",
-        lazy="dynamic",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_gigs_active_cat",
+            "category",
+            "created_at",
+            postgresql_where=text("status = 'active'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -204,7 +252,12 @@ class GigResponse(Base, UUIDMixin, TimestampMixin):
 
     # Status
     status: Mapped[GigResponseStatus] = mapped_column(
-        Enum(GigResponseStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigResponseStatus,
+            name="gigresponsestatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=GigResponseStatus.PENDING,
         nullable=False,
         index=True,
@@ -225,6 +278,15 @@ class GigResponse(Base, UUIDMixin, TimestampMixin):
         uselist=False,
     )
 
+    __table_args__ = (
+        Index(
+            "ix_gig_responses_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<GigResponse {self.id}>"
 
@@ -273,7 +335,12 @@ class GigTransaction(Base, UUIDMixin, TimestampMixin):
 
     # Status
     status: Mapped[GigTransactionStatus] = mapped_column(
-        Enum(GigTransactionStatus, values_callable=lambda x: [e.value for e in x]),
+        ENUM(
+            GigTransactionStatus,
+            name="gigtransactionstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=GigTransactionStatus.PENDING,
         nullable=False,
         index=True,
@@ -391,7 +458,3 @@ class GigRating(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<GigRating {self.id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
@@ -1,14 +1,19 @@
 import enum
 import uuid
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text, ForeignKey, Numeric, ARRAY, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, ForeignKey, Numeric, Enum, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+    from app.models.transaction import MarketplaceTransaction
+
 
 class MarketplaceCategory(str, enum.Enum):
     """Categories for marketplace listings."""
@@ -93,7 +98,6 @@ class MarketplaceListing(Base, UUIDMixin, TimestampMixin):
         Enum(ListingStatus, values_callable=lambda x: [e.value for e in x]),
         default=ListingStatus.ACTIVE,
         nullable=False,
-        index=True,
     )
 
     # Location preference
@@ -127,10 +131,23 @@ class MarketplaceListing(Base, UUIDMixin, TimestampMixin):
         uselist=False,
     )
 
+    __table_args__ = (
+        Index("ix_marketplace_listings_course_codes_gin", "course_codes", postgresql_using="gin"),
+        Index(
+            "ix_listings_active_cat_created",
+            "category",
+            "created_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Trigram GIN so the ILIKE '%term%' search is an index scan
+        Index(
+            "ix_listings_text_trgm",
+            "title",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops", "description": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<MarketplaceListing {self.id} - {self.title}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
-from app.models.transaction import MarketplaceTransaction  # noqa: E402, F401
@@ -1,11 +1,12 @@
 """Marketplace review model with multi-category ratings."""
 
 import uuid
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
-    Integer,
+    SmallInteger,
     Text,
     UniqueConstraint,
 )
@@ -15,6 +16,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+    from app.models.transaction import MarketplaceTransaction
+
 
 class MarketplaceReview(Base, UUIDMixin, TimestampMixin):
     """Reviews for completed marketplace transactions with multi-category ratings."""
@@ -26,7 +31,6 @@ class MarketplaceReview(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("marketplace_transactions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Reviewer (person writing the review)
@@ -47,15 +51,15 @@ class MarketplaceReview(Base, UUIDMixin, TimestampMixin):
 
     # Multi-category ratings (1-5 stars each)
     item_accuracy: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         nullable=False,
     )
     communication: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         nullable=False,
     )
     punctuality: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         nullable=False,
     )
 
@@ -82,7 +86,8 @@ class MarketplaceReview(Base, UUIDMixin, TimestampMixin):
     )
 
     __table_args__ = (
-        # Unique constraint: one review per transaction per reviewer
+        # Unique constraint: one review per transaction per reviewer (its index
+        # also serves transaction_id lookups)
         UniqueConstraint(
             "transaction_id",
             "reviewer_id",
@@ -108,15 +113,5 @@ class MarketplaceReview(Base, UUIDMixin, TimestampMixin):
         ),
     )
 
-    @property
-    def average_rating(self) -> float:
-        """Calculate average of all category ratings."""
-        return (self.item_accuracy + self.communication + self.punctuality) / 3.0
-
     def __repr__(self) -> str:
         return f"<MarketplaceReview {self.id} - Transaction {self.transaction_id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
-from app.models.transaction import MarketplaceTransaction  # noqa: E402, F401
@@ -1,6 +1,7 @@
 import enum
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import String, Text, ForeignKey, DateTime, Enum, Index, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
@@ -9,6 +10,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class ConversationStatus(str, enum.Enum):
     """Status for conversations."""
@@ -67,6 +71,12 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
+    # Denormalized from messages so the inbox sorts on a column, not a MAX()
+    last_message_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
     # Relationships
     user1: Mapped["User"] = relationship(
         "User",
@@ -83,14 +93,17 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
     messages: Mapped[list["Message"]] = relationship(
         "Message",
         back_populates="conversation",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
         cascade="all, delete-orphan",
         order_by="Message.created_at",
     )
 
-    # Composite index for finding conversations between two users
+    # Composite index for finding conversations between two users; the pair
+    # is stored in canonical order so a single probe answers both directions
     __table_args__ = (
         Index("ix_conversations_users", "user1_id", "user2_id", unique=True),
+        CheckConstraint("user1_id < user2_id", name="ck_conversations_user_order"),
     )
 
     def __repr__(self) -> str:
@@ -117,7 +130,6 @@ class Message(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     sender_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -160,6 +172,8 @@ class Message(Base, UUIDMixin, TimestampMixin):
     )
 
     __table_args__ = (
+        # Thread pages and last-message lookups walk this backwards with LIMIT
+        Index("ix_messages_conv_created", "conversation_id", "created_at"),
         CheckConstraint(
             "content IS NOT NULL OR image_url IS NOT NULL",
             name="ck_messages_has_content",
@@ -168,7 +182,3 @@ class Message(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Message {self.id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
@@ -3,6 +3,7 @@
 import enum
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     CheckConstraint,
@@ -18,6 +19,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class ReportReason(str, enum.Enum):
     """Reasons for reporting a user."""
@@ -119,7 +123,3 @@ class UserReport(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<UserReport {self.id} - {self.reason.value}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     String,
@@ -19,6 +20,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class Residence(Base, UUIDMixin, TimestampMixin):
     """York University on-campus residence."""
@@ -90,7 +94,8 @@ class ResidenceChannel(Base, UUIDMixin, TimestampMixin):
         "ResidenceMessage",
         back_populates="channel",
         cascade="all, delete-orphan",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
         order_by="ResidenceMessage.created_at.desc()",
     )
     channel_members: Mapped[list["ResidenceChannelMember"]] = relationship(
@@ -224,7 +229,3 @@ class ResidenceMessage(Base, UUIDMixin):
 
     def __repr__(self) -> str:
         return f"<ResidenceMessage {self.id} in {self.channel_id}>"
-
-
-# Circular import resolution
-from app.models.user import User  # noqa: E402, F401
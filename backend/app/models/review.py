@@ -1,5 +1,6 @@
 import enum
 import uuid
+from typing import TYPE_CHECKING
 
 from sqlalchemy import String, Text, ForeignKey, Integer, Enum, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
@@ -8,6 +9,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class ReviewType(str, enum.Enum):
     """Type of review."""
@@ -89,7 +93,3 @@ class Review(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Review {self.id} - {self.rating}/5>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
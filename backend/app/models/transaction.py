@@ -3,6 +3,7 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     Boolean,
@@ -18,6 +19,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.user import User
+    from app.models.marketplace import MarketplaceListing
+    from app.models.marketplace_review import MarketplaceReview
+
 
 class MarketplaceTransaction(Base, UUIDMixin, TimestampMixin):
     """Transaction record for marketplace sales."""
@@ -90,7 +96,8 @@ class MarketplaceTransaction(Base, UUIDMixin, TimestampMixin):
     reviews: Mapped[list["MarketplaceReview"]] = relationship(
         "MarketplaceReview",
         back_populates="transaction",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -100,9 +107,3 @@ class MarketplaceTransaction(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<MarketplaceTransaction {self.id} - Listing {self.listing_id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
-from app.models.marketplace import MarketplaceListing  # noqa: E402, F401
-from app.models.marketplace_review import MarketplaceReview  # noqa: E402, F401
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import String, Boolean, ARRAY, Text, Integer, Numeric, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -8,6 +9,19 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.vault import VaultPost, VaultComment
+    from app.models.marketplace import MarketplaceListing
+    from app.models.buddy import BuddyRequest
+    from app.models.review import Review
+    from app.models.transaction import MarketplaceTransaction
+    from app.models.marketplace_review import MarketplaceReview
+    from app.models.report import UserReport
+    from app.models.course import CourseMember
+    from app.models.feedback import UserFeedback
+    from app.models.gig import Gig, GigResponse, GigTransaction, GigRating
+    from app.models.residence import ResidenceMember
+
 
 class User(Base, UUIDMixin, TimestampMixin):
     """User model for York University students."""
@@ -27,13 +41,6 @@ class User(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
-    # Trust system
-    completed_transactions: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-    )
-
     # Gig marketplace stats
     gig_rating_avg: Mapped[Decimal] = mapped_column(
         Numeric(3, 2),
@@ -133,141 +140,148 @@ class User(Base, UUIDMixin, TimestampMixin):
     vault_posts: Mapped[list["VaultPost"]] = relationship(
         "VaultPost",
         back_populates="author",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     vault_comments: Mapped[list["VaultComment"]] = relationship(
         "VaultComment",
         back_populates="author",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     marketplace_listings: Mapped[list["MarketplaceListing"]] = relationship(
         "MarketplaceListing",
         back_populates="seller",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     buddy_requests: Mapped[list["BuddyRequest"]] = relationship(
         "BuddyRequest",
         back_populates="host",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     reviews_given: Mapped[list["Review"]] = relationship(
         "Review",
         foreign_keys="Review.reviewer_id",
         back_populates="reviewer",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     reviews_received: Mapped[list["Review"]] = relationship(
         "Review",
         foreign_keys="Review.reviewed_id",
         back_populates="reviewed",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Transaction relationships
     sales_transactions: Mapped[list["MarketplaceTransaction"]] = relationship(
         "MarketplaceTransaction",
         foreign_keys="MarketplaceTransaction.seller_id",
         back_populates="seller",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     purchase_transactions: Mapped[list["MarketplaceTransaction"]] = relationship(
         "MarketplaceTransaction",
         foreign_keys="MarketplaceTransaction.buyer_id",
         back_populates="buyer",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Marketplace review relationships
     marketplace_reviews_given: Mapped[list["MarketplaceReview"]] = relationship(
         "MarketplaceReview",
         foreign_keys="MarketplaceReview.reviewer_id",
         back_populates="reviewer",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     marketplace_reviews_received: Mapped[list["MarketplaceReview"]] = relationship(
         "MarketplaceReview",
         foreign_keys="MarketplaceReview.reviewee_id",
         back_populates="reviewee",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Report relationships
     reports_submitted: Mapped[list["UserReport"]] = relationship(
         "UserReport",
         foreign_keys="UserReport.reporter_id",
         back_populates="reporter",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     reports_received: Mapped[list["UserReport"]] = relationship(
         "UserReport",
         foreign_keys="UserReport.reported_user_id",
         back_populates="reported_user",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Course membership relationships
     course_memberships: Mapped[list["CourseMember"]] = relationship(
         "CourseMember",
         back_populates="user",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Feedback submissions
     feedback_submissions: Mapped[list["UserFeedback"]] = relationship(
         "UserFeedback",
         back_populates="user",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Gig relationships
     gigs: Mapped[list["Gig"]] = relationship(
         "Gig",
         back_populates="poster",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     gig_responses: Mapped[list["GigResponse"]] = relationship(
         "GigResponse",
         back_populates="responder",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     gig_transactions_as_provider: Mapped[list["GigTransaction"]] = relationship(
         "GigTransaction",
         foreign_keys="GigTransaction.provider_id",
         back_populates="provider",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     gig_transactions_as_client: Mapped[list["GigTransaction"]] = relationship(
         "GigTransaction",
         foreign_keys="GigTransaction.client_id",
         back_populates="client",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     gig_ratings_given: Mapped[list["GigRating"]] = relationship(
         "GigRating",
         foreign_keys="GigRating.rater_id",
         back_populates="rater",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     gig_ratings_received: Mapped[list["GigRating"]] = relationship(
         "GigRating",
         foreign_keys="GigRating.ratee_id",
         back_populates="ratee",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     # Residence membership relationships
     residence_memberships: Mapped[list["ResidenceMember"]] = relationship(
         "ResidenceMember",
         back_populates="user",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         return f"<User {self.email}>"
-
-
-# Import for type hints (avoid circular imports)
-from app.models.vault import VaultPost, VaultComment  # noqa: E402, F401
-from app.models.marketplace import MarketplaceListing  # noqa: E402, F401
-from app.models.buddy import BuddyRequest  # noqa: E402, F401
-from app.models.review import Review  # noqa: E402, F401
-from app.models.transaction import MarketplaceTransaction  # noqa: E402, F401
-from app.models.marketplace_review import MarketplaceReview  # noqa: E402, F401
-from app.models.report import UserReport  # noqa: E402, F401
-from app.models.course import CourseMember  # noqa: E402, F401
-from app.models.feedback import UserFeedback  # noqa: E402, F401
-from app.models.gig import Gig, GigResponse, GigTransaction, GigRating  # noqa: E402, F401
-from app.models.residence import ResidenceMember  # noqa: E402, F401
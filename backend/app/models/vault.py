@@ -1,12 +1,26 @@
 import enum
 import uuid
-
-from sqlalchemy import String, Boolean, Text, ForeignKey, Integer, Enum, ARRAY
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    ARRAY,
+    Boolean,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.user import User
 
 
 class VaultCategory(str, enum.Enum):
@@ -49,7 +63,6 @@ class VaultPost(Base, UUIDMixin, TimestampMixin):
     category: Mapped[VaultCategory] = mapped_column(
         Enum(VaultCategory, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
-        index=True,
     )
 
     # Anonymity
@@ -99,10 +112,26 @@ class VaultPost(Base, UUIDMixin, TimestampMixin):
     comments: Mapped[list["VaultComment"]] = relationship(
         "VaultComment",
         back_populates="post",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Feed: active posts newest first, optionally within one category
+        Index(
+            "ix_vault_posts_active_created",
+            "created_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_vault_posts_active_cat_created",
+            "category",
+            "created_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<VaultPost {self.id} - {self.category.value}>"
 
@@ -130,7 +159,6 @@ class VaultComment(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("vault_posts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -170,7 +198,8 @@ class VaultComment(Base, UUIDMixin, TimestampMixin):
     replies: Mapped[list["VaultComment"]] = relationship(
         "VaultComment",
         back_populates="parent",
-        lazy="dynamic",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     parent: Mapped["VaultComment | None"] = relationship(
         "VaultComment",
@@ -178,9 +207,10 @@ class VaultComment(Base, UUIDMixin, TimestampMixin):
         remote_side="VaultComment.id",
     )
 
+    __table_args__ = (
+        # Comment threads are read per post in created_at order
+        Index("ix_vault_comments_post_created", "post_id", "created_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<VaultComment {self.id}>"
-
-
-# Import for type hints
-from app.models.user import User  # noqa: E402, F401
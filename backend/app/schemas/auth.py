@@ -5,6 +5,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from app.schemas.common import ImageContentType, StillImageContentType
+
 
 def _load_admin_emails() -> set[str]:
     """Load admin emails from config (env var ADMIN_EMAILS, comma-separated)."""
@@ -14,13 +16,17 @@ def _load_admin_emails() -> set[str]:
 
 ADMIN_EMAILS = _load_admin_emails()
 
+# Matched against the lower-cased address
+YORK_EMAIL_SUFFIXES = ("@yorku.ca", "@my.yorku.ca")
+
+# Letters, spaces, hyphens and apostrophes
+NAME_RE = re.compile(r"[a-zA-Z\s\-']+")
+
 
 def is_valid_email(email: str) -> bool:
     """Check if email is valid (York email or admin exception)."""
     email_lower = email.lower()
-    if email_lower in _load_admin_emails():
-        return True
-    return email_lower.endswith("@yorku.ca") or email_lower.endswith("@my.yorku.ca")
+    return email_lower in ADMIN_EMAILS or email_lower.endswith(YORK_EMAIL_SUFFIXES)
 
 
 class SignupRequest(BaseModel):
@@ -152,7 +158,7 @@ class NameVerificationRequest(BaseModel):
         # Remove extra whitespace
         cleaned = " ".join(v.split())
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-']+$", cleaned):
+        if not NAME_RE.fullmatch(cleaned):
             raise ValueError("Name can only contain letters, spaces, hyphens, and apostrophes")
         return cleaned
 
@@ -169,7 +175,7 @@ class IDUploadRequest(BaseModel):
     """Request for presigned URL to upload student ID."""
 
     filename: str
-    content_type: Annotated[str, Field(pattern=r"^image/(jpeg|png|webp)$")]
+    content_type: StillImageContentType
 
 
 class IDUploadResponse(BaseModel):
@@ -210,8 +216,7 @@ class UserResponse(BaseModel):
     campus_days: list[str] | None = None
     interests: list[str] | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -249,7 +254,7 @@ class AvatarUploadRequest(BaseModel):
     """Request for presigned URL to upload avatar."""
 
     filename: str
-    content_type: Annotated[str, Field(pattern=r"^image/(jpeg|png|webp|gif)$")]
+    content_type: ImageContentType
 
 
 class AvatarUploadResponse(BaseModel):
@@ -273,8 +278,7 @@ class PublicUserResponse(BaseModel):
     interests: list[str] | None = None
     created_at: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
     @field_validator("interests")
     @classmethod
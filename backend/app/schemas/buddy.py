@@ -1,13 +1,16 @@
 """Side Quests (buddy matching) schemas."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.models.buddy import BuddyCategory, BuddyRequestStatus, ParticipantStatus, VibeLevel
 from app.schemas.user import UserMinimal
 
+# Slack on the "start_time in the future" check to absorb network latency
+_START_TIME_SLACK = timedelta(seconds=30)
+
 
 class BuddyRequestCreate(BaseModel):
     """Schema for creating a buddy request (Side Quest)."""
@@ -26,40 +29,25 @@ class BuddyRequestCreate(BaseModel):
     max_participants: Annotated[int, Field(ge=1, le=100)] = 2
     requires_approval: bool = True
 
-    @field_validator("custom_category")
-    @classmethod
-    def validate_custom_category(cls, v: str | None, info) -> str | None:
-        # custom_category required if category is CUSTOM
-        if info.data.get("category") == BuddyCategory.CUSTOM and not v:
-            raise ValueError("custom_category required when category is 'custom'")
-        return v
-
-    @field_validator("custom_vibe_level")
-    @classmethod
-    def validate_custom_vibe_level(cls, v: str | None, info) -> str | None:
-        # custom_vibe_level required if vibe_level is CUSTOM
-        if info.data.get("vibe_level") == VibeLevel.CUSTOM and not v:
-            raise ValueError("custom_vibe_level required when vibe_level is 'custom'")
-        return v
-
     @field_validator("start_time")
     @classmethod
     def validate_start_time(cls, v: datetime) -> datetime:
-        from datetime import timedelta
         # Must be in the future (with 30 second tolerance for network latency)
-        if v < datetime.now(v.tzinfo) - timedelta(seconds=30):
+        if v < datetime.now(v.tzinfo) - _START_TIME_SLACK:
             raise ValueError("start_time must be in the future")
         return v
 
-    @field_validator("end_time")
-    @classmethod
-    def validate_end_time(cls, v: datetime | None, info) -> datetime | None:
+    @model_validator(mode="after")
+    def validate_cross_fields(self) -> "BuddyRequestCreate":
+        # Checks that depend on other fields, done once the model is built
+        if self.category == BuddyCategory.CUSTOM and not self.custom_category:
+            raise ValueError("custom_category required when category is 'custom'")
+        if self.vibe_level == VibeLevel.CUSTOM and not self.custom_vibe_level:
+            raise ValueError("custom_vibe_level required when vibe_level is 'custom'")
         # End time must be after start time if provided
-        if v is not None:
-            start_time = info.data.get("start_time")
-            if start_time and v <= start_time:
-                raise ValueError("end_time must be after start_time")
-        return v
+        if self.end_time is not None and self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
 
 
 class BuddyRequestUpdate(BaseModel):
@@ -101,8 +89,7 @@ class BuddyRequestResponse(BaseModel):
     host: UserMinimal
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class BuddyRequestListResponse(BaseModel):
@@ -140,8 +127,7 @@ class ParticipantResponse(BaseModel):
     message: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ParticipantListResponse(BaseModel):
@@ -173,8 +159,7 @@ class QuestMessageReplyInfo(BaseModel):
     content: str
     sender: UserMinimal
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class QuestMessageResponse(BaseModel):
@@ -187,8 +172,7 @@ class QuestMessageResponse(BaseModel):
     created_at: datetime
     is_deleted: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class QuestMessagesResponse(BaseModel):
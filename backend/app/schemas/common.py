@@ -0,0 +1,10 @@
+"""Field types shared across schema modules."""
+
+from typing import Literal
+
+# Image MIME types accepted for presigned uploads. A Literal is checked by
+# pydantic-core with a set lookup instead of a regex match.
+ImageContentType = Literal["image/jpeg", "image/png", "image/webp", "image/gif"]
+
+# Uploads that must be still images (ID scans, listing photos)
+StillImageContentType = Literal["image/jpeg", "image/png", "image/webp"]
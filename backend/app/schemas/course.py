@@ -4,9 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.course import ChannelType
+from app.schemas.common import ImageContentType
 
 
 # ============ Course Schemas ============
@@ -25,8 +26,7 @@ class CourseBase(BaseModel):
     campus: str | None
     member_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class CourseResponse(CourseBase):
@@ -45,8 +45,7 @@ class CourseSearchResult(BaseModel):
     year: int
     member_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class CourseSearchResponse(BaseModel):
@@ -107,8 +106,7 @@ class ChannelBase(BaseModel):
     member_count: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ChannelResponse(ChannelBase):
@@ -153,8 +151,7 @@ class ReplyInfo(BaseModel):
     image_url: str | None
     author: MessageAuthor
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class MessageResponse(BaseModel):
@@ -168,8 +165,7 @@ class MessageResponse(BaseModel):
     reply_to: ReplyInfo | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class MessageCreate(BaseModel):
@@ -179,17 +175,19 @@ class MessageCreate(BaseModel):
     image_url: Annotated[str | None, Field(default=None, max_length=500)] = None
     reply_to_id: str | None = None
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_has_content(self) -> "MessageCreate":
         """Validate that at least one of message or image_url is provided."""
         if not self.message and not self.image_url:
             raise ValueError("Message must have either text or an image (or both)")
+        return self
 
 
 class ChatImageUploadRequest(BaseModel):
     """Request for chat image upload URL."""
 
     filename: str
-    content_type: Annotated[str, Field(pattern=r"^image/(jpeg|png|gif|webp)$")]
+    content_type: ImageContentType
 
 
 class ChatImageUploadResponse(BaseModel):
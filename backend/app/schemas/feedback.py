@@ -23,8 +23,7 @@ class FeedbackAuthor(BaseModel):
     name: str
     email: str
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class FeedbackResponse(BaseModel):
@@ -40,8 +39,7 @@ class FeedbackResponse(BaseModel):
     created_at: datetime
     user: FeedbackAuthor
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class FeedbackListResponse(BaseModel):
@@ -7,15 +7,29 @@ from typing import Annotated
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.marketplace import MarketplaceCategory, ListingStatus, ListingCondition
+from app.schemas.common import StillImageContentType
 from app.schemas.user import UserMinimal
 
 
+def _clean_course_codes(codes: list[str]) -> list[str]:
+    """Normalize course codes (e.g., "EECS 1001", "MATH 1300") for storage.
+
+    Codes are upper-cased so the course filter's @> lookup matches them.
+    """
+    cleaned = []
+    for code in codes[:5]:  # Max 5 course codes
+        code = code.upper().strip()[:20]
+        if code:
+            cleaned.append(code)
+    return cleaned
+
+
 class ListingCreate(BaseModel):
     """Schema for creating a marketplace listing."""
 
     title: Annotated[str, Field(min_length=3, max_length=200)]
     description: Annotated[str, Field(min_length=10, max_length=5000)]
-    price: Annotated[Decimal, Field(ge=0, le=100000)]
+    price: Annotated[Decimal, Field(ge=0, le=100000, decimal_places=2)]
     is_negotiable: bool = False
     category: MarketplaceCategory
     condition: ListingCondition | None = None
@@ -28,13 +42,7 @@ class ListingCreate(BaseModel):
     def validate_course_codes(cls, v: list[str] | None) -> list[str] | None:
         if v is None:
             return None
-        # Clean and validate course codes (e.g., "EECS 1001", "MATH 1300")
-        cleaned = []
-        for code in v[:5]:  # Max 5 course codes
-            code = code.upper().strip()[:20]
-            if code:
-                cleaned.append(code)
-        return cleaned if cleaned else None
+        return _clean_course_codes(v) or None
 
     @field_validator("images")
     @classmethod
@@ -50,7 +58,7 @@ class ListingUpdate(BaseModel):
 
     title: Annotated[str | None, Field(min_length=3, max_length=200)] = None
     description: Annotated[str | None, Field(min_length=10, max_length=5000)] = None
-    price: Annotated[Decimal | None, Field(ge=0, le=100000)] = None
+    price: Annotated[Decimal | None, Field(ge=0, le=100000, decimal_places=2)] = None
     is_negotiable: bool | None = None
     category: MarketplaceCategory | None = None
     condition: ListingCondition | None = None
@@ -59,6 +67,14 @@ class ListingUpdate(BaseModel):
     preferred_meetup_location: Annotated[str | None, Field(max_length=200)] = None
     status: ListingStatus | None = None
 
+    @field_validator("course_codes")
+    @classmethod
+    def validate_course_codes(cls, v: list[str] | None) -> list[str] | None:
+        # An empty list still clears the listing's course codes
+        if v is None:
+            return None
+        return _clean_course_codes(v)
+
 
 class ListingResponse(BaseModel):
     """Response schema for a listing."""
@@ -79,8 +95,7 @@ class ListingResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ListingListResponse(BaseModel):
@@ -109,7 +124,7 @@ class ImageUploadRequest(BaseModel):
     """Request for image upload URL."""
 
     filename: str
-    content_type: Annotated[str, Field(pattern=r"^image/(jpeg|png|webp)$")]
+    content_type: StillImageContentType
 
 
 class ImageUploadResponse(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 from app.schemas.user import UserMinimal
 
@@ -28,12 +28,16 @@ class MarketplaceReviewResponse(BaseModel):
     item_accuracy: int
     communication: int
     punctuality: int
-    average_rating: float
     text_feedback: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+    @computed_field
+    @property
+    def average_rating(self) -> float:
+        """Average of the three category ratings."""
+        return (self.item_accuracy + self.communication + self.punctuality) / 3.0
 
 
 class MarketplaceReviewListResponse(BaseModel):
@@ -3,9 +3,10 @@
 from datetime import datetime
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.messaging import ConversationStatus
+from app.schemas.common import ImageContentType
 
 
 class ParticipantInfo(BaseModel):
@@ -24,8 +25,7 @@ class MessageReplyInfo(BaseModel):
     content: str | None
     image_url: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class MessageResponse(BaseModel):
@@ -42,8 +42,7 @@ class MessageResponse(BaseModel):
     read_at: datetime | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ConversationCreate(BaseModel):
@@ -70,8 +69,7 @@ class ConversationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ConversationListResponse(BaseModel):
@@ -87,23 +85,8 @@ class PendingRequestsResponse(BaseModel):
     requests: list[ConversationResponse]
 
 
-class ConversationDetailResponse(BaseModel):
-    """Detailed conversation with all info."""
-
-    id: str
-    participants: list[ParticipantInfo]
-    initiator_id: str
-    status: ConversationStatus
-    last_message: MessageResponse | None
-    last_message_at: datetime | None
-    unread_count: int
-    context_type: str | None
-    context_id: str | None
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
+# The detail view returns exactly the list item shape; one model, one core schema
+ConversationDetailResponse = ConversationResponse
 
 
 class MessageCreate(BaseModel):
@@ -113,17 +96,19 @@ class MessageCreate(BaseModel):
     image_url: Annotated[str | None, Field(default=None, max_length=500)] = None
     reply_to_id: str | None = None
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_has_content(self) -> "MessageCreate":
         """Validate that at least one of content or image_url is provided."""
         if not self.content and not self.image_url:
             raise ValueError("Message must have either text or an image (or both)")
+        return self
 
 
 class ChatImageUploadRequest(BaseModel):
     """Request for chat image upload URL."""
 
     filename: str
-    content_type: Annotated[str, Field(pattern=r"^image/(jpeg|png|gif|webp)$")]
+    content_type: ImageContentType
 
 
 class ChatImageUploadResponse(BaseModel):
@@ -26,8 +26,7 @@ class ReportResponse(BaseModel):
     status: ReportStatus
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ReportAdminResponse(BaseModel):
@@ -45,8 +44,7 @@ class ReportAdminResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ReportAdminUpdate(BaseModel):
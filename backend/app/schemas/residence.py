@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class ResidenceResponse(BaseModel):
@@ -13,8 +13,7 @@ class ResidenceResponse(BaseModel):
     member_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ResidenceListResponse(BaseModel):
@@ -30,8 +29,7 @@ class ResidenceChannelResponse(BaseModel):
     created_at: datetime
     unread_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class JoinResidenceResponse(BaseModel):
@@ -56,8 +54,7 @@ class ResidenceReplyInfo(BaseModel):
     image_url: str | None
     author: ResidenceMessageAuthor
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ResidenceMessageResponse(BaseModel):
@@ -69,8 +66,7 @@ class ResidenceMessageResponse(BaseModel):
     reply_to: ResidenceReplyInfo | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ResidenceMessageCreate(BaseModel):
@@ -78,9 +74,11 @@ class ResidenceMessageCreate(BaseModel):
     image_url: Annotated[str | None, Field(default=None, max_length=500)] = None
     reply_to_id: str | None = None
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_has_content(self) -> "ResidenceMessageCreate":
         if not self.message and not self.image_url:
             raise ValueError("Message must have either text or an image (or both)")
+        return self
 
 
 class ResidenceMessageListResponse(BaseModel):
@@ -30,8 +30,7 @@ class ReviewResponse(BaseModel):
     reference_id: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ReviewListResponse(BaseModel):
@@ -14,7 +14,8 @@ class TransactionCreate(BaseModel):
 
     listing_id: str
     buyer_id: str
-    final_price: Annotated[Decimal, Field(gt=0)]
+    # Matches the Numeric(10, 2) column
+    final_price: Annotated[Decimal, Field(gt=0, max_digits=10, decimal_places=2)]
 
 
 class TransactionConfirm(BaseModel):
@@ -38,8 +39,7 @@ class TransactionResponse(BaseModel):
     completed_at: datetime | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class TransactionListResponse(BaseModel):
@@ -1,9 +1,12 @@
 """User schemas."""
 
 from datetime import datetime
+from functools import lru_cache
 
 from pydantic import BaseModel
 
+from app.models.user import User
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -34,8 +37,7 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class UserPublic(BaseModel):
@@ -47,16 +49,37 @@ class UserPublic(BaseModel):
     avatar_url: str | None = None
     interests: list[str] | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class UserMinimal(BaseModel):
-    """Minimal user info for listings, posts, etc."""
+    """Minimal user info for listings, posts, etc.
+
+    Frozen because user_minimal() shares instances across requests.
+    """
 
     id: str
     name: str
     avatar_url: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True, "frozen": True}
+
+
+# User columns that UserMinimal renders; load_only() these on eager loads
+# that feed user_minimal()
+USER_MINIMAL_COLUMNS = (User.id, User.name, User.avatar_url)
+
+
+@lru_cache(maxsize=4096)
+def _user_minimal(id: str, name: str, avatar_url: str | None) -> UserMinimal:
+    return UserMinimal(id=id, name=name, avatar_url=avatar_url)
+
+
+def user_minimal(user: User) -> UserMinimal:
+    """Shared UserMinimal for a user row.
+
+    Keyed on every rendered field, so a renamed user or new avatar simply
+    misses the cache. The same seller/author repeated across a list page
+    reuses one (frozen) instance.
+    """
+    return _user_minimal(str(user.id), user.name, user.avatar_url)
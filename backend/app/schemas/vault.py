@@ -44,8 +44,7 @@ class VaultPostResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class VaultPostListResponse(BaseModel):
@@ -84,8 +83,7 @@ class VaultCommentResponse(BaseModel):
     author: UserMinimal | None  # None if anonymous
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class VaultCommentListResponse(BaseModel):
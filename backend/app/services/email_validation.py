@@ -2,6 +2,13 @@
 
 import re
 
+# Separators between name parts in an email local part
+_SEPARATOR_RE = re.compile(r"[._\-]")
+_DIGITS_RE = re.compile(r"\d+")
+
+# RFC 5321 limit on the local part; anything past it is not a real mailbox
+MAX_LOCAL_PART_LENGTH = 64
+
 
 class EmailValidationService:
     """Service for validating York University emails and matching names."""
@@ -10,8 +17,7 @@ class EmailValidationService:
 
     def is_valid_york_email(self, email: str) -> bool:
         """Check if email is a valid York University email."""
-        email_lower = email.lower()
-        return any(email_lower.endswith(domain) for domain in self.VALID_DOMAINS)
+        return email.lower().endswith(self.VALID_DOMAINS)
 
     def extract_email_parts(self, email: str) -> tuple[str, str]:
         """Extract local part and domain from email.
@@ -33,15 +39,17 @@ class EmailValidationService:
             kartik.7777xyz@yorku.ca -> ["kartik", "xyz"]
         """
         local_part, _ = self.extract_email_parts(email)
+        # Bound the work below no matter what reaches us
+        local_part = local_part[:MAX_LOCAL_PART_LENGTH]
 
         # Split by common separators
-        parts = re.split(r"[._\-]", local_part)
+        parts = _SEPARATOR_RE.split(local_part)
 
         # Clean each part: remove numbers, keep only letters
         cleaned_parts = []
         for part in parts:
             # Remove digits
-            letters_only = re.sub(r"\d+", "", part)
+            letters_only = _DIGITS_RE.sub("", part)
             if letters_only and len(letters_only) >= 1:
                 cleaned_parts.append(letters_only.lower())
 
@@ -76,16 +84,20 @@ class EmailValidationService:
         if not email_parts:
             return False, "Could not extract name from email"
 
-        # Check if first name appears in email parts
-        first_name_found = any(
-            first_name == part or first_name.startswith(part) or part.startswith(first_name)
-            for part in email_parts
-            if len(part) >= 2  # Ignore single-letter parts for matching
+        # Filter once; single-letter parts are ignored for matching and the
+        # substring fallback only considers parts of three letters or more
+        matchable_parts = [part for part in email_parts if len(part) >= 2]
+        long_parts = [part for part in matchable_parts if len(part) >= 3]
+
+        # Check if first name appears in email parts (exact match is the common case)
+        first_name_found = first_name in matchable_parts or any(
+            first_name.startswith(part) or part.startswith(first_name)
+            for part in matchable_parts
         )
 
         if not first_name_found:
             # Also check if first name is contained within any email part
-            first_name_found = any(first_name in part or part in first_name for part in email_parts if len(part) >= 3)
+            first_name_found = any(first_name in part or part in first_name for part in long_parts)
 
         if not first_name_found:
             return False, "First name not found in email. ID verification required."
@@ -93,10 +105,9 @@ class EmailValidationService:
         # Check if surname also matches (optional, but nice to confirm)
         if len(name_parts) > 1:
             surname = name_parts[-1]
-            surname_found = any(
-                surname == part or surname.startswith(part) or part.startswith(surname)
-                for part in email_parts
-                if len(part) >= 2
+            surname_found = surname in matchable_parts or any(
+                surname.startswith(part) or part.startswith(surname)
+                for part in matchable_parts
             )
             if surname_found:
                 return True, "Full name verified from email"
@@ -9,6 +9,22 @@ import httpx
 
 from app.core.config import settings
 
+# Anything but letters, whitespace, hyphens and apostrophes is stripped from names
+_NAME_STRIP_RE = re.compile(r"[^a-zA-Z\s\-']")
+
+# Quick PII checks, in the order their types are reported
+_PII_PATTERNS = (
+    ("email", re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")),
+    ("phone", re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b")),
+    (
+        "address",
+        re.compile(
+            r"\b\d+\s+[A-Za-z]+\s+(Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd)\b",
+            re.I,
+        ),
+    ),
+)
+
 
 class GeminiService:
     """Service for Gemini AI operations."""
@@ -20,6 +36,19 @@ class GeminiService:
             self.model = genai.GenerativeModel("gemini-2.0-flash")
         else:
             self.model = None
+        self._http_client: httpx.AsyncClient | None = None
+
+    async def get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client (keeps S3 connections alive)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def extract_name_from_id(self, image_url: str) -> tuple[bool, str | None, str]:
         """Extract name from student ID photo using Gemini Vision.
@@ -35,11 +64,11 @@ class GeminiService:
 
         try:
             # Download image
-            async with httpx.AsyncClient() as client:
-                response = await client.get(image_url)
-                if response.status_code != 200:
-                    return False, None, "Failed to download image"
-                image_data = response.content
+            client = await self.get_http_client()
+            response = await client.get(image_url)
+            if response.status_code != 200:
+                return False, None, "Failed to download image"
+            image_data = response.content
 
             # Encode image to base64
             image_base64 = base64.b64encode(image_data).decode("utf-8")
@@ -91,7 +120,7 @@ Respond with ONLY the name or "UNABLE_TO_EXTRACT". No explanations."""
     def _clean_extracted_name(self, text: str) -> str | None:
         """Clean and validate an extracted name."""
         # Remove any non-letter characters except spaces, hyphens, apostrophes
-        cleaned = re.sub(r"[^a-zA-Z\s\-']", "", text)
+        cleaned = _NAME_STRIP_RE.sub("", text)
         cleaned = " ".join(cleaned.split())  # Normalize whitespace
 
         # Validate: should have at least 2 parts (first and last name)
@@ -168,19 +197,9 @@ Be strict about personal information but lenient on casual language."""
         Returns:
             Tuple of (has_pii, list_of_pii_types_found)
         """
-        pii_found = []
-
-        # Email pattern
-        if re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", content):
-            pii_found.append("email")
-
-        # Phone pattern (various formats)
-        if re.search(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", content):
-            pii_found.append("phone")
-
-        # Address patterns (simplified)
-        if re.search(r"\b\d+\s+[A-Za-z]+\s+(Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd)\b", content, re.I):
-            pii_found.append("address")
+        pii_found = [
+            pii_type for pii_type, pattern in _PII_PATTERNS if pattern.search(content)
+        ]
 
         return len(pii_found) > 0, pii_found
 
@@ -7,6 +7,10 @@ from jose import JWTError, jwt
 
 from app.core.config import settings
 
+# Our tokens are a few hundred bytes; anything far outside this is not one of ours
+MIN_TOKEN_LENGTH = 20
+MAX_TOKEN_LENGTH = 4096
+
 
 class TokenType:
     ACCESS = "access"
@@ -61,35 +65,37 @@ class JWTService:
         }
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
-    def verify_access_token(self, token: str) -> dict | None:
-        """Verify an access token and return the payload."""
+    def _decode(self, token: str, token_type: str) -> dict | None:
+        """Decode and verify a token of the given type.
+
+        Strings that can't be a compact JWT (header.payload.signature) are
+        rejected before jose base64-decodes, parses and HMACs them.
+        """
+        if (
+            token.count(".") != 2
+            or not MIN_TOKEN_LENGTH <= len(token) <= MAX_TOKEN_LENGTH
+        ):
+            return None
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            if payload.get("type") != TokenType.ACCESS:
-                return None
-            return payload
         except JWTError:
             return None
+        if payload.get("type") != token_type:
+            return None
+        return payload
+
+    def verify_access_token(self, token: str) -> dict | None:
+        """Verify an access token and return the payload."""
+        return self._decode(token, TokenType.ACCESS)
 
     def verify_refresh_token(self, token: str) -> dict | None:
         """Verify a refresh token and return the payload."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            if payload.get("type") != TokenType.REFRESH:
-                return None
-            return payload
-        except JWTError:
-            return None
+        return self._decode(token, TokenType.REFRESH)
 
     def verify_email_token(self, token: str) -> str | None:
         """Verify an email verification token and return the email."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            if payload.get("type") != TokenType.EMAIL_VERIFICATION:
-                return None
-            return payload.get("sub")
-        except JWTError:
-            return None
+        payload = self._decode(token, TokenType.EMAIL_VERIFICATION)
+        return payload.get("sub") if payload else None
 
     def create_token_pair(self, user_id: str, email: str) -> tuple[str, str, int]:
         """Create both access and refresh tokens.
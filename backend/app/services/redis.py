@@ -1,11 +1,25 @@
 """Redis service for caching and rate limiting."""
 
+import logging
 from typing import Any
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# INCR, set the window expiry on the first hit and read the TTL in one round
+# trip; atomic, so a key can't be left without an expiry between the calls
+_RATE_LIMIT_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {current, redis.call('TTL', KEYS[1])}
+"""
+
 
 class RedisService:
     """Service for Redis operations."""
@@ -68,6 +82,42 @@ class RedisService:
         return await client.ttl(key)
 
 
+class PageCache:
+    """Short-lived cache for list pages that look the same to every viewer.
+
+    Keys embed a per-namespace generation counter. invalidate() bumps it,
+    which orphans every cached page at once; the orphans age out on their TTL.
+    """
+
+    def __init__(self, redis_service: RedisService, namespace: str, ttl_seconds: int):
+        self.redis = redis_service
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._gen_key = f"{namespace}:list:gen"
+
+    async def key(self, *parts: object) -> str:
+        """Build the cache key for one page; None parts become empty segments."""
+        gen = await self.redis.get(self._gen_key) or "0"
+        return f"{self.namespace}:list:" + ":".join(
+            [gen, *("" if p is None else str(p) for p in parts)]
+        )
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached page."""
+        return await self.redis.get(key)
+
+    async def set(self, key: str, payload: str) -> None:
+        """Cache a rendered page for ttl_seconds."""
+        await self.redis.set(key, payload, expire_seconds=self.ttl_seconds)
+
+    async def invalidate(self) -> None:
+        """Orphan every cached page in the namespace after a write."""
+        try:
+            await self.redis.incr(self._gen_key)
+        except Exception as e:
+            logger.warning("%s list cache invalidation failed: %s", self.namespace, e)
+
+
 class RateLimiter:
     """Rate limiter using Redis sliding window."""
 
@@ -80,6 +130,8 @@ class RateLimiter:
         self.redis = redis_service
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self._script: AsyncScript | None = None
+        self._script_client: redis.Redis | None = None
 
     async def is_allowed(self, identifier: str, endpoint: str = "default") -> tuple[bool, dict]:
         """Check if request is allowed under rate limit.
@@ -95,16 +147,11 @@ class RateLimiter:
 
         try:
             client = await self.redis.get_client()
+            if self._script is None or self._script_client is not client:
+                self._script = client.register_script(_RATE_LIMIT_SCRIPT)
+                self._script_client = client
 
-            # Increment counter
-            current = await client.incr(key)
-
-            # Set expiry on first request
-            if current == 1:
-                await client.expire(key, self.window_seconds)
-
-            # Get TTL
-            ttl = await client.ttl(key)
+            current, ttl = await self._script(keys=[key], args=[self.window_seconds])
 
             info = {
                 "limit": self.max_requests,
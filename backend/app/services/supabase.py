@@ -179,7 +179,8 @@ class SupabaseAuthService:
 
         # Fallback to Supabase magic link
         try:
-            self.client.auth.sign_in_with_otp({
+            # The supabase client is synchronous; keep its HTTP call off the event loop
+            await asyncio.to_thread(self.client.auth.sign_in_with_otp, {
                 "email": email,
                 "options": {"should_create_user": True},
             })
@@ -209,7 +210,7 @@ class SupabaseAuthService:
 
         # Supabase magic-link fallback verification
         try:
-            response = self.client.auth.verify_otp({
+            response = await asyncio.to_thread(self.client.auth.verify_otp, {
                 "email": email,
                 "token": token,
                 "type": "email",
@@ -0,0 +1 @@
+"""Background workers that run outside the API process."""
@@ -0,0 +1,90 @@
+"""
+Standalone worker that periodically cleans up expired quests.
+
+Runs in its own process (see docker-compose.yml / render.yaml) so the hourly
+scan never competes with HTTP traffic for the API's event loop or its
+connection pool. Deployments without this worker keep
+QUEST_CLEANUP_IN_PROCESS=true and the API runs the same loop itself.
+
+Usage:
+    python -m app.workers.quest_cleanup_worker
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.services.quest_cleanup import cleanup_quests
+
+logger = logging.getLogger(__name__)
+
+# Run cleanup every hour
+CLEANUP_INTERVAL_SECONDS = 3600
+# Wait a bit before retrying on error
+RETRY_DELAY_SECONDS = 60
+
+
+async def cleanup_forever(
+    session_maker: async_sessionmaker[AsyncSession],
+    startup_delay: float = 0,
+) -> None:
+    """Run cleanup_quests every CLEANUP_INTERVAL_SECONDS until cancelled.
+
+    startup_delay postpones the first run, so API boots and rolling restarts
+    don't each fire a cleanup.
+    """
+    await asyncio.sleep(startup_delay)
+    while True:
+        try:
+            async with session_maker() as db:
+                result = await cleanup_quests(db)
+            logger.info("Quest cleanup completed: %s", result)
+            await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Quest cleanup error")
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+
+async def run_quest_cleanup_loop() -> None:
+    """Run cleanup_quests forever on a small dedicated connection pool."""
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=2,
+        max_overflow=0,
+        pool_recycle=1800,
+        connect_args={
+            "statement_cache_size": 0,  # Required for Supabase transaction pooler (pgbouncer)
+            "command_timeout": 30,
+        },
+    )
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+    logger.info("Quest cleanup worker started (interval=%ss)", CLEANUP_INTERVAL_SECONDS)
+    try:
+        await cleanup_forever(session_maker)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    setup_logging()
+    try:
+        asyncio.run(run_quest_cleanup_loop())
+    except KeyboardInterrupt:
+        logger.info("Quest cleanup worker stopped")
+
+
+if __name__ == "__main__":
+    main()
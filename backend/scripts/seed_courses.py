@@ -5,11 +5,13 @@ Run this after migrations to populate the courses table.
 """
 
 import asyncio
+import enum
 import json
 import uuid
 from pathlib import Path
 
-from sqlalchemy import select, text
+from sqlalchemy import Table, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add parent directory to path for imports
 import sys
@@ -18,6 +20,41 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.database import async_session_maker
 from app.models.course import Course, CourseChannel, ChannelType
 
+# Below this many rows an executemany INSERT is cheaper than setting up COPY
+COPY_THRESHOLD = 100
+
+
+async def bulk_copy(db: AsyncSession, table: Table, rows: list[dict]) -> None:
+    """COPY rows into table over the session's asyncpg connection.
+
+    Columns with a server default are left to the database; scalar Python
+    defaults are filled in here since COPY never runs them. Enums are sent
+    as their stored values.
+    """
+    columns = [c for c in table.columns if c.server_default is None]
+    records = []
+    for row in rows:
+        record = []
+        for column in columns:
+            if column.key in row:
+                value = row[column.key]
+            elif column.default is not None and column.default.is_scalar:
+                value = column.default.arg
+            else:
+                value = None
+            if isinstance(value, enum.Enum):
+                value = value.value
+            record.append(value)
+        records.append(tuple(record))
+
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[c.name for c in columns],
+    )
+
 
 async def seed_courses() -> dict:
     """Seed courses from courses_seed.json."""
@@ -63,37 +100,42 @@ async def seed_courses() -> dict:
             print("Nothing to add!")
             return {"courses_created": 0, "channels_created": 0}
 
-        # Batch insert
-        batch_size = 100
+        # Bulk insert: COPY for large seeds, one executemany per batch otherwise
+        use_copy = len(new_courses) >= COPY_THRESHOLD
+        batch_size = 1000
         for i in range(0, len(new_courses), batch_size):
             batch = new_courses[i:i+batch_size]
 
+            course_rows = []
+            channel_rows = []
             for course_data in batch:
                 course_id = uuid.uuid4()
-
-                course = Course(
-                    id=course_id,
-                    code=course_data["code"],
-                    name=course_data["name"],
-                    faculty=course_data["faculty"],
-                    programs=course_data["programs"],
-                    year=course_data["year"],
-                    credits=course_data.get("credits"),
-                    campus=course_data.get("campus"),
-                )
-                db.add(course)
-                courses_created += 1
-
-                general_channel = CourseChannel(
-                    id=uuid.uuid4(),
-                    course_id=course_id,
-                    name="general",
-                    type=ChannelType.GENERAL,
-                )
-                db.add(general_channel)
-                channels_created += 1
-
+                course_rows.append({
+                    "id": course_id,
+                    "code": course_data["code"],
+                    "name": course_data["name"],
+                    "faculty": course_data["faculty"],
+                    "programs": course_data["programs"],
+                    "year": course_data["year"],
+                    "credits": course_data.get("credits"),
+                    "campus": course_data.get("campus"),
+                })
+                channel_rows.append({
+                    "id": uuid.uuid4(),
+                    "course_id": course_id,
+                    "name": "general",
+                    "type": ChannelType.GENERAL,
+                })
+
+            if use_copy:
+                await bulk_copy(db, Course.__table__, course_rows)
+                await bulk_copy(db, CourseChannel.__table__, channel_rows)
+            else:
+                await db.execute(insert(Course), course_rows)
+                await db.execute(insert(CourseChannel), channel_rows)
             await db.commit()
+            courses_created += len(course_rows)
+            channels_created += len(channel_rows)
             print(f"Committed batch {i//batch_size + 1}/{(len(new_courses) + batch_size - 1)//batch_size} ({courses_created} courses)")
 
     result = {